@@ -7,7 +7,7 @@ from typing import Any, Dict, List
 from langchain_community.embeddings import HuggingFaceEmbeddings
 
 from graph.state import ResearchState
-from tools.academic_tools import fetch_arxiv_structured, scholar_search
+from tools.parallel_fetch import gather_sources_sync
 from utils.llm_registry import get_llm
 from utils.structured_data import build_structured_record
 
@@ -59,10 +59,11 @@ def _structure_generic_item(item: Any) -> Dict[str, Any]:
     )
 
 
-def _fetch_results(tool: Any, query: str, limit: int) -> Dict[str, Any]:
-    """Execute *tool* with *query* and return structured items plus error context."""
+def _structure_results(raw: Any, limit: int) -> Dict[str, Any]:
+    """Turn raw tool output (or the exception it raised) into structured items plus error context."""
+    if isinstance(raw, Exception):
+        return {"items": [], "error": str(raw)}
     try:
-        raw = tool.run(query)
         normalized = _normalize_results(raw, limit)
         structured = [_structure_generic_item(item) for item in normalized]
         return {"items": structured}
@@ -77,7 +78,18 @@ def research_academic_papers(state: ResearchState) -> dict:
     mode = state.get("mode", "extended")
     num_items = 2 if mode == "simple" else 10
 
-    arxiv_items, arxiv_error = fetch_arxiv_structured(topic, num_items)
+    # arXiv and Scholar are independent hosts: query both at once
+    fetched = gather_sources_sync(
+        topic,
+        sources=("arxiv", "scholar"),
+        max_results=num_items,
+        scholar_query=f"site:scholar.google.com {topic}",
+    )
+    arxiv_raw = fetched["arxiv"]
+    if isinstance(arxiv_raw, Exception):
+        arxiv_items, arxiv_error = [], str(arxiv_raw)
+    else:
+        arxiv_items, arxiv_error = arxiv_raw
     arxiv_metadata = {
         "limit": num_items,
         "item_count": len(arxiv_items),
@@ -85,7 +97,7 @@ def research_academic_papers(state: ResearchState) -> dict:
     if arxiv_error:
         arxiv_metadata["error"] = arxiv_error
 
-    scholar_payload = _fetch_results(scholar_search, f"site:scholar.google.com {topic}", num_items)
+    scholar_payload = _structure_results(fetched["scholar"], num_items)
 
     sources: List[Dict[str, Any]] = [
         {
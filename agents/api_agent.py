@@ -9,6 +9,9 @@ import asyncio
 from typing import Dict, List, Any
 from datetime import datetime
 
+from utils.fast_json import loads
+from utils.http import get_async_session
+
 
 class APIAgent:
     """
@@ -115,14 +118,14 @@ class APIAgent:
                 "sortOrder": "descending"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    self.arxiv_base_url,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    response.raise_for_status()
-                    xml_content = await response.text()
+            session = get_async_session()
+            async with session.get(
+                self.arxiv_base_url,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                response.raise_for_status()
+                xml_content = await response.text()
             
             # Parse XML (simple extraction)
             import xml.etree.ElementTree as ET
@@ -174,14 +177,14 @@ class APIAgent:
                 "language": "en"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    self.news_base_url,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
+            session = get_async_session()
+            async with session.get(
+                self.news_base_url,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                response.raise_for_status()
+                data = await response.json(loads=loads)
             
             articles = data.get('articles', [])
             
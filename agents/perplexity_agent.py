@@ -4,6 +4,7 @@ Handles various Perplexity API response formats
 """
 
 import os
+import zipfile
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
@@ -17,6 +18,9 @@ except ImportError as e:
         "Install with: pip install aiohttp==3.9.1"
     ) from e
 
+from utils.fast_json import loads
+from utils.http import get_async_session
+
 
 class PerplexityAgent:
     """
@@ -82,15 +86,15 @@ class PerplexityAgent:
         
         # Execute API call
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.api_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=60)
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
+            session = get_async_session()
+            async with session.post(
+                self.api_url,
+                headers=headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=60)
+            ) as response:
+                response.raise_for_status()
+                data = await response.json(loads=loads)
             
             # Extract response with error handling
             try:
@@ -277,6 +281,7 @@ class PerplexityAgent:
     
     def _load_domain_prompt(self, domain: str, query: str) -> str:
         """Load domain-specific prompt from prompts directory"""
+        self._extract_prompt_archive()
         domain_file = self.prompts_dir / f"perplexity_prompt_{domain}.txt"
         
         if not domain_file.exists():
@@ -302,6 +307,23 @@ class PerplexityAgent:
             print(f"   ⚠️ Error loading prompt from {domain_file}: {e}")
             return self._get_builtin_prompt(domain)
     
+    def _extract_prompt_archive(self):
+        """Extract prompts.zip (from create_prompts.py --archive) on first use"""
+        archive = self.prompts_dir / "prompts.zip"
+        if not archive.exists():
+            return
+        
+        try:
+            with zipfile.ZipFile(archive) as zf:
+                missing = [
+                    name for name in zf.namelist()
+                    if not (self.prompts_dir / name).exists()
+                ]
+                if missing:
+                    zf.extractall(self.prompts_dir, members=missing)
+        except (OSError, zipfile.BadZipFile) as e:
+            print(f"   ⚠️ Error extracting prompt archive {archive}: {e}")
+    
     def _get_domain_focus(self, domain: str) -> str:
         """Get domain-specific focus description"""
         focuses = {
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import time
+from datetime import date
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -25,6 +26,8 @@ _DOMAIN_ALIASES = {
     "tech": "technology",
 }
 _PERPLEXITY_SOURCE = "https://www.perplexity.ai"
+# Stands in for the topic inside the static prompt; the real topic follows in the dynamic tail
+_TOPIC_REFERENCE = "the research topic stated at the end of these instructions"
 
 
 class _SafeFormatDict(dict):
@@ -53,6 +56,12 @@ def _load_prompt_template(custom_path: Optional[str]) -> str:
     )
 
 
+@lru_cache(maxsize=4)
+def _get_client(api_key: str) -> PerplexityClient:
+    """Reuse one client (and its keep-alive session) per API key across runs."""
+    return PerplexityClient(api_key)
+
+
 def _normalize_domain(value: str | None) -> str:
     """Map user-supplied domain names to Perplexity's supported categories."""
     if not value:
@@ -63,8 +72,13 @@ def _normalize_domain(value: str | None) -> str:
     return _DOMAIN_ALIASES.get(key, "general")
 
 
-def _build_system_prompt(domain: str, topic: str, prompt_path: Optional[str]) -> str:
-    """Insert the domain-specific focus and topic into the system prompt template."""
+@lru_cache(maxsize=32)
+def _build_system_prompt(domain: str, prompt_path: Optional[str]) -> str:
+    """Insert the domain-specific focus into the system prompt template.
+
+    The topic is deliberately left out so the prompt is identical for every
+    call in a domain and can be served from the provider's prompt cache.
+    """
     template = _load_prompt_template(prompt_path)
     focus = PerplexityClient.SUPPORTED_DOMAINS.get(
         domain, PerplexityClient.SUPPORTED_DOMAINS["general"]
@@ -72,12 +86,17 @@ def _build_system_prompt(domain: str, topic: str, prompt_path: Optional[str]) ->
     context = _SafeFormatDict(
         domain=domain,
         domain_focus=focus,
-        topic=topic,
-        query=topic,
+        topic=_TOPIC_REFERENCE,
+        query=_TOPIC_REFERENCE,
     )
     return template.format_map(context)
 
 
+def _build_dynamic_context(topic: str) -> str:
+    """Per-call context appended after the static system prompt."""
+    return f"Research topic: {topic}\nCurrent date: {date.today().isoformat()}"
+
+
 def _build_overview_item(topic: str, sections: Dict[str, Any], content: str) -> Dict[str, Any]:
     """Construct the primary summary record shown to downstream agents."""
     summary = sections.get("summary") or None
@@ -152,14 +171,15 @@ def research_perplexity(state: ResearchState) -> Dict[str, Dict[str, Any]]:
     mode = state.get("mode", "extended")
     max_tokens = 900 if mode == "simple" else 2200
 
-    client = PerplexityClient(api_key)
+    client = _get_client(api_key)
     prompt_path = state.get("perplexity_prompt_path")
-    system_prompt = _build_system_prompt(domain, topic, prompt_path)
+    system_prompt = _build_system_prompt(domain, prompt_path)
     response = client.deep_search(
         topic,
         system_prompt,
         domain=domain,
         max_tokens=max_tokens,
+        system_dynamic=_build_dynamic_context(topic),
     )
     elapsed = time.perf_counter() - overall_start
 
@@ -237,6 +257,8 @@ def research_perplexity(state: ResearchState) -> Dict[str, Dict[str, Any]]:
         "completion_tokens": metrics.completion_tokens,
         "call_duration": metrics.duration,
         "citation_count": response.get("citation_count", 0),
+        "cached_prompt_tokens": response.get("cached_prompt_tokens", 0),
+        "system_prompt_hash": response.get("system_prompt_hash"),
     }
     if domain_label:
         details["domain_label"] = str(domain_label)
@@ -5,7 +5,7 @@ import time
 from typing import Any, Dict, List
 
 from graph.state import ResearchState
-from tools.web_search_tools import duckduckgo_search, serpapi_search, tavily_search
+from tools.web_search_tools import cached_search, get_duckduckgo, get_serpapi, get_tavily
 from utils.structured_data import build_structured_record
 
 
@@ -71,7 +71,7 @@ def _fetch_tool_results(tool: Any, topic: str, limit: int) -> Dict[str, Any]:
     if not tool:
         return {"items": [], "error": "tool_unavailable"}
     try:
-        raw = tool.run(topic)
+        raw = cached_search(tool, topic)
         normalized = _normalize_results(raw, limit)
         return {"items": _structure_items(normalized)}
     except Exception as exc:  # pragma: no cover - defensive
@@ -96,9 +96,9 @@ def research_web(state: ResearchState, mode: str = "extended") -> dict:
 
     sources: List[Dict[str, Any]] = []
     for name, tool in (
-        ("serpapi", serpapi_search),
-        ("tavily", tavily_search),
-        ("duckduckgo", duckduckgo_search),
+        ("serpapi", get_serpapi()),
+        ("tavily", get_tavily()),
+        ("duckduckgo", get_duckduckgo()),
     ):
         payload = _fetch_tool_results(tool, topic, num_items)
         sources.append(_build_source_payload(name, payload, num_items))
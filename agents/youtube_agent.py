@@ -17,6 +17,7 @@ from requests import Session
 
 from graph.state import ResearchState
 from utils.config_loader import get_youtube_api_key
+from utils.fast_json import loads
 from utils.llm_registry import invoke_llm, zero_metrics
 from utils.structured_data import build_structured_record
 
@@ -85,7 +86,7 @@ def _search_videos(
     
     response = session.get(url, params=params, timeout=30)
     response.raise_for_status()
-    data = response.json()
+    data = loads(response.content)
     
     results = []
     for item in data.get("items", []):
@@ -120,7 +121,7 @@ def _fetch_video_details(api_key: str, video_ids: List[str]) -> Dict[str, Dict[s
     
     response = session.get(url, params=params, timeout=30)
     response.raise_for_status()
-    data = response.json()
+    data = loads(response.content)
     
     details_map = {}
     for item in data.get("items", []):
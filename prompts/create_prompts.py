@@ -1,17 +1,37 @@
 """
 Script to create all prompt files in prompts/ directory
-Run: python create_prompts.py
+Run: python create_prompts.py [--archive] [--sequential]
+
+With --archive, all prompts are stored in a single prompts/prompts.zip
+instead of individual .txt files. Individual files are written concurrently
+unless --sequential is given.
 """
 
+import argparse
+import asyncio
+import os
+import sys
+import zipfile
 from pathlib import Path
 
-# Create prompts directory
-prompts_dir = Path("prompts")
-prompts_dir.mkdir(exist_ok=True)
+# Write buffer for prompt files (128 KiB keeps each file to a single write)
+WRITE_BUFFER_SIZE = 1 << 17
+
+# Create-or-truncate in a single open; O_BINARY only exists on Windows
+WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+PROMPTS_DIR = Path("prompts")
+
+
+def _load_prompts():
+    """Build the prompt templates on demand as one packed UTF-8 blob
 
-# Prompt templates
-PROMPTS = {
-    "perplexity_prompt.txt": """You are an expert research assistant conducting comprehensive deep research.
+    Kept inside a function so importing this module does not materialize them.
+    Returns (blob, index) where index maps filename -> ((offset, length), ...)
+    for the header, body and footer segments of each prompt.
+    """
+    raw_prompts = {
+        "perplexity_prompt.txt": """You are an expert research assistant conducting comprehensive deep research.
 
 Research Focus: {domain_focus}
 
@@ -64,7 +84,7 @@ CRITICAL REQUIREMENTS:
 ✓ Use professional, clear language
 """,
 
-    "perplexity_prompt_stocks.txt": """You are a senior financial analyst specializing in equity research and stock market analysis.
+        "perplexity_prompt_stocks.txt": """You are a senior financial analyst specializing in equity research and stock market analysis.
 
 Research Focus: {domain_focus}
 
@@ -132,7 +152,7 @@ CRITICAL REQUIREMENTS:
 ✓ Include forward-looking estimates where available
 """,
 
-    "perplexity_prompt_medical.txt": """You are a medical research specialist with expertise in evidence-based medicine and clinical research.
+        "perplexity_prompt_medical.txt": """You are a medical research specialist with expertise in evidence-based medicine and clinical research.
 
 Research Focus: {domain_focus}
 
@@ -208,7 +228,7 @@ CRITICAL REQUIREMENTS:
 ✓ Use proper medical terminology
 """,
 
-    "perplexity_prompt_academic.txt": """You are an academic research specialist conducting scholarly literature review.
+        "perplexity_prompt_academic.txt": """You are an academic research specialist conducting scholarly literature review.
 
 Research Focus: {domain_focus}
 
@@ -295,7 +315,7 @@ CRITICAL REQUIREMENTS:
 ✓ Maintain academic rigor and objectivity
 """,
 
-    "perplexity_prompt_technology.txt": """You are a technology research analyst specializing in emerging tech, product analysis, and innovation trends.
+        "perplexity_prompt_technology.txt": """You are a technology research analyst specializing in emerging tech, product analysis, and innovation trends.
 
 Research Focus: {domain_focus}
 
@@ -394,15 +414,141 @@ CRITICAL REQUIREMENTS:
 ✓ Distinguish hype from reality
 ✓ Maintain technical accuracy
 """
-}
-
-# Create all prompt files
-for filename, content in PROMPTS.items():
-    filepath = prompts_dir / filename
-    filepath.write_text(content.strip(), encoding='utf-8')
-    print(f"✓ Created: {filepath}")
-
-print(f"\n✅ All {len(PROMPTS)} prompt files created in {prompts_dir}/")
-print("\nPrompt files created:")
-for filename in PROMPTS.keys():
-    print(f"  - {filename}")
\ No newline at end of file
+    }
+
+    blob = bytearray()
+    index = {}
+    for name, text in raw_prompts.items():
+        data = text.strip().encode('utf-8')
+        start = len(blob)
+        blob += data
+        # header (role/topic) | body (## sections) | footer (CRITICAL REQUIREMENTS)
+        header_end = data.find(b"\n## ") + 1
+        footer_start = data.find(b"\nCRITICAL REQUIREMENTS:") + 1
+        cuts = sorted({0, header_end, footer_start, len(data)})
+        index[name] = tuple((start + a, b - a) for a, b in zip(cuts, cuts[1:]))
+
+    return bytes(blob), index
+
+
+def _prompt_views(blob, index):
+    """Slice each prompt's segments out of the packed blob without copying"""
+    view = memoryview(blob)
+    return {name: [view[offset:offset + length] for offset, length in segments]
+            for name, segments in index.items()}
+
+
+def _matches(existing, segments):
+    """Check whether file content equals the concatenated segments"""
+    existing = memoryview(existing)
+    pos = 0
+    for segment in segments:
+        end = pos + len(segment)
+        if existing[pos:end] != segment:
+            return False
+        pos = end
+    return pos == len(existing)
+
+
+def _writev_all(fd, segments):
+    """writev() until every byte is on disk; a short write resumes mid-segment"""
+    remaining = list(segments)
+    while remaining:
+        written = os.writev(fd, remaining)
+        done = 0
+        while done < len(remaining) and written >= len(remaining[done]):
+            written -= len(remaining[done])
+            done += 1
+        remaining = remaining[done:]
+        if remaining:
+            remaining[0] = remaining[0][written:]
+
+
+def _write_prompt(filepath, segments):
+    """Write one encoded prompt to disk, skipping files that are already current
+
+    Segments are written with a single scatter-gather writev() where the
+    platform provides it. Returns True if the file was written, False if its
+    content was unchanged.
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            if _matches(f.read(), segments):
+                return False
+    except FileNotFoundError:
+        pass
+
+    # Truncation happens as part of open(), never as a separate call
+    fd = os.open(filepath, WRITE_FLAGS, 0o644)
+    if hasattr(os, "writev"):
+        try:
+            _writev_all(fd, segments)
+        finally:
+            os.close(fd)
+    else:
+        with os.fdopen(fd, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            for segment in segments:
+                f.write(segment)
+    return True
+
+
+async def _write_prompts_concurrently(prompts, paths):
+    """Write all prompts in worker threads so their disk latency overlaps"""
+    return await asyncio.gather(*[
+        asyncio.to_thread(_write_prompt, filepath, prompts[filename])
+        for filename, filepath in paths.items()
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create prompt files")
+    parser.add_argument("--archive", action="store_true",
+                        help="write all prompts into a single prompts.zip")
+    parser.add_argument("--sequential", action="store_true",
+                        help="write prompt files one at a time")
+    args = parser.parse_args()
+
+    # Create prompts directory
+    if not PROMPTS_DIR.is_dir():
+        PROMPTS_DIR.mkdir()
+
+    prompts = _prompt_views(*_load_prompts())
+
+    lines = []
+    if args.archive:
+        # Single archive write instead of one file creation per prompt
+        archive_path = PROMPTS_DIR / "prompts.zip"
+        with zipfile.ZipFile(archive_path, 'w', compression=zipfile.ZIP_STORED) as zf:
+            for filename, content in prompts.items():
+                zf.writestr(filename, b"".join(content))
+        lines.append(f"✓ Created: {archive_path}")
+        lines.append(f"\n✅ All {len(prompts)} prompts archived in {archive_path}")
+    else:
+        # Create all prompt files
+        base = str(PROMPTS_DIR)
+        paths = {filename: os.path.join(base, filename) for filename in prompts}
+        if args.sequential:
+            written = [_write_prompt(filepath, prompts[filename])
+                       for filename, filepath in paths.items()]
+        else:
+            written = asyncio.run(_write_prompts_concurrently(prompts, paths))
+
+        for filepath, was_written in zip(paths.values(), written):
+            status = "Created" if was_written else "Unchanged"
+            lines.append(f"✓ {status}: {filepath}")
+
+        created = sum(written)
+        unchanged = len(prompts) - created
+        if unchanged:
+            lines.append(f"\n✅ {created} prompt files created, {unchanged} unchanged in {PROMPTS_DIR}/")
+        else:
+            lines.append(f"\n✅ All {len(prompts)} prompt files created in {PROMPTS_DIR}/")
+
+    lines.append("\nPrompt files:")
+    lines.extend(f"  - {filename}" for filename in prompts)
+
+    # One write to stdout instead of one per line
+    sys.stdout.write("\n".join(lines) + "\n")
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,36 @@ Research Engine Module - COMPLETE FIX
 - No transcript errors
 """
 
+import asyncio
 import time
-import json
 import os
+import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from functools import lru_cache
+from itertools import cycle, islice
+from io import BytesIO
 from pathlib import Path
+from lxml import etree
 from utils import console_log
+from utils.caching import ResponseCache, make_cache_key
+
+# orjson parses response bytes directly and faster; stdlib json also accepts bytes
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# API keys are read once at import (the environment is loaded before startup)
+_PERPLEXITY_API_KEY = os.getenv("PERPLEXITY_API_KEY")
+_OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
+
+def _refresh_keys():
+    """Re-read API keys from the environment (e.g. after load_dotenv or in tests)"""
+    global _PERPLEXITY_API_KEY, _OPENROUTER_API_KEY
+    _PERPLEXITY_API_KEY = os.getenv("PERPLEXITY_API_KEY")
+    _OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 
 # Perplexity Models Configuration
 PERPLEXITY_MODELS = {
@@ -28,13 +52,56 @@ PERPLEXITY_MODELS = {
     }
 }
 
+def _build_session():
+    """Shared HTTP session so repeat calls to the same host reuse connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3,
+                          status_forcelist=(429, 500, 502, 503, 504))
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+_SESSION = _build_session()
+
+# Repeat Perplexity/OpenRouter requests are served from here for a day
+_RESPONSE_CACHE = ResponseCache()
+
+# arXiv Atom feed lookups, compiled once
+_ATOM_NS = {'atom': 'http://www.w3.org/2005/Atom'}
+_ATOM_ENTRY_TAG = '{http://www.w3.org/2005/Atom}entry'
+_ATOM_TITLE_XP = etree.XPath('string(atom:title)', namespaces=_ATOM_NS)
+_ATOM_SUMMARY_XP = etree.XPath('string(atom:summary)', namespaces=_ATOM_NS)
+_ATOM_ID_XP = etree.XPath('string(atom:id)', namespaces=_ATOM_NS)
+
+# Bullet or numbered list line (pre-stripped): "- text", "• text", "1. text", "2) text"
+_BULLET_RE = re.compile(r'^(?:[-•]|\d+[.)])\s+(.*)$')
+
+# "[3] summary text" markers in batched summarization replies
+_SUMMARY_MARKER_RE = re.compile(r'^\s*\[(\d+)\]\s*', re.MULTILINE)
+
+_MOCK_DATA_FILE = Path("prompts/mock_data.json")
+
 def load_mock_data():
-    """Load mock data from JSON file"""
+    """Load mock data from JSON file (re-parsed only when the file changes)"""
+    try:
+        mtime = _MOCK_DATA_FILE.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    return _load_mock_data_cached(mtime)
+
+@lru_cache(maxsize=1)
+def _load_mock_data_cached(mtime):
+    """Parse mock data; mtime is only the cache key"""
     try:
-        mock_file = Path("prompts/mock_data.json")
+        mock_file = _MOCK_DATA_FILE
         if mock_file.exists():
-            with open(mock_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(mock_file, 'rb') as f:
+                return _json_loads(f.read())
     except Exception as e:
         console_log(f"Error loading mock data: {e}", "ERROR")
     
@@ -44,159 +111,187 @@ def load_mock_data():
         "insights": ["Mock insight 1", "Mock insight 2"]
     }
 
+def _citation_to_source(i, citation, search_url):
+    """Convert one Perplexity citation (usually a URL string) into a source dict"""
+    if isinstance(citation, str):
+        title = citation
+        url = citation if citation[:4] == 'http' else search_url
+    else:
+        title = f"Source {i+1}"
+        url = search_url
+    
+    return {
+        "title": title,
+        "url": url,
+        "summary": f"Citation #{i+1} from Perplexity research",
+        "agent": "Market Intelligence",
+        "source_type": "Web Research",
+        "medium": "Perplexity API"
+    }
+
 def call_perplexity_api_directly(query, model_type, max_sources):
     """
     Call Perplexity API and extract diverse sources with citations
     """
-    api_key = os.getenv("PERPLEXITY_API_KEY")
+    api_key = _PERPLEXITY_API_KEY
     if not api_key:
-        raise Exception("PERPLEXITY_API_KEY not found in environment variables")
+        raise ValueError("PERPLEXITY_API_KEY not found in environment variables")
     
     model = PERPLEXITY_MODELS[model_type]["model"]
     
+    # Query variants used in fallback source URLs
+    q_plus = query.replace(' ', '+')
+    q_dash = query.replace(' ', '-').lower()
+    
     console_log(f"📡 Calling Perplexity API: {model}", "INFO")
     
-    try:
-        response = requests.post(
+    payload = {
+        "model": model,
+        "messages": [
+            {
+                "role": "system",
+                "content": "You are a research assistant. Provide detailed, factual research with key findings and actionable insights."
+            },
+            {
+                "role": "user",
+                "content": f"Research this topic thoroughly and provide comprehensive analysis with sources: {query}"
+            }
+        ],
+        "max_tokens": 2000,
+        "temperature": 0.2,
+        "return_citations": True,  # Request citations
+        "search_recency_filter": "month"  # Recent sources
+    }
+    cache_key = make_cache_key(model, payload["messages"], payload["temperature"], payload["max_tokens"])
+    
+    data = _RESPONSE_CACHE.get(cache_key)
+    cached = data is not None
+    
+    if cached:
+        console_log("♻️ Perplexity API: cache hit", "INFO")
+    else:
+        response = _SESSION.post(
             "https://api.perplexity.ai/chat/completions",
             headers={
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json"
             },
-            json={
-                "model": model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are a research assistant. Provide detailed, factual research with key findings and actionable insights."
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Research this topic thoroughly and provide comprehensive analysis with sources: {query}"
-                    }
-                ],
-                "max_tokens": 2000,
-                "temperature": 0.2,
-                "return_citations": True,  # Request citations
-                "search_recency_filter": "month"  # Recent sources
-            },
+            json=payload,
             timeout=60
         )
         
         if response.status_code != 200:
-            error_detail = response.json() if response.content else {"error": "No details"}
-            raise Exception(f"API status {response.status_code}: {error_detail}")
-        
-        data = response.json()
-        
-        # Extract response content
-        content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-        if not content:
-            raise Exception("Empty response from Perplexity API")
-        
-        # Extract citations (Perplexity returns them in the response)
-        citations = data.get("citations", [])
-        
-        # Extract token usage
-        usage = data.get("usage", {})
-        total_tokens = usage.get("total_tokens", 0)
-        prompt_tokens = usage.get("prompt_tokens", 0)
-        completion_tokens = usage.get("completion_tokens", 0)
-        
-        # Calculate cost
-        cost_multiplier = PERPLEXITY_MODELS[model_type]["cost_multiplier"]
-        cost = (total_tokens / 1000) * 0.002 * cost_multiplier
-        
-        # Parse findings and insights from content
-        findings = []
-        insights = []
-        
-        lines = content.split('\n')
-        for line in lines:
-            line = line.strip()
-            if line and (line.startswith('-') or line.startswith('•') or 
-                        (len(line) > 2 and line[0:2].replace('.','').isdigit())):
-                cleaned = line.lstrip('-•0123456789. ').strip()
-                if len(findings) < 5:
-                    findings.append(cleaned)
-                elif len(insights) < 3:
-                    insights.append(cleaned)
-        
-        if not findings:
-            # Extract first sentences as findings
-            sentences = [s.strip() + '.' for s in content.split('.') if len(s.strip()) > 20]
-            findings = sentences[:5]
-        
-        if not insights:
-            insights = ["Research provides valuable market intelligence",
-                       "Multiple perspectives analyzed for comprehensive view"]
-        
-        # FIXED: Create diverse sources from citations
-        sources = []
-        if citations and len(citations) > 0:
-            # Use actual citations from Perplexity
-            for i, citation in enumerate(citations[:max_sources]):
-                sources.append({
-                    "title": citation if isinstance(citation, str) else f"Source {i+1}",
-                    "url": citation if citation.startswith('http') else f"https://www.perplexity.ai/search?q={query.replace(' ', '+')}",
-                    "summary": f"Citation #{i+1} from Perplexity research",
-                    "agent": "Market Intelligence",
-                    "source_type": "Web Research",
-                    "medium": "Perplexity API"
-                })
-        else:
-            # Fallback: Create diverse placeholder sources
-            diverse_domains = [
-                "bloomberg.com",
-                "reuters.com", 
-                "forbes.com",
-                "wsj.com",
-                "ft.com",
-                "cnbc.com",
-                "economist.com",
-                "marketwatch.com"
-            ]
-            
-            for i in range(min(max_sources, len(diverse_domains))):
-                sources.append({
-                    "title": f"Research finding from {diverse_domains[i]}",
-                    "url": f"https://www.{diverse_domains[i]}/research/{query.replace(' ', '-').lower()}",
-                    "summary": findings[i] if i < len(findings) else f"Analysis from {diverse_domains[i]}",
-                    "agent": "Market Intelligence",
-                    "source_type": "Web Research",
-                    "medium": "Perplexity API"
-                })
-        
-        console_log(f"✅ Perplexity API: {total_tokens} tokens, {len(sources)} sources", "INFO")
+            try:
+                error_detail = _json_loads(response.content) if response.content else {"error": "No details"}
+            except ValueError:
+                error_detail = {"error": response.text[:200]}
+            raise requests.HTTPError(f"API status {response.status_code}: {error_detail}", response=response)
         
-        return {
-            "success": True,
-            "agent_name": "Market Intelligence",
-            "summary": content[:500] if content else f"Analysis of {max_sources} sources for: {query}",
-            "findings": findings[:5],
-            "insights": insights[:3],
-            "sources": sources,
-            "source_count": len(sources),
-            "sources_retrieved": len(sources),
-            "tokens": total_tokens,
-            "prompt_tokens": prompt_tokens,
-            "completion_tokens": completion_tokens,
-            "cost": cost,
-            "status": "✅ Success",
-            "model_used": model,
-            "model_type": model_type,
-            "medium": "Perplexity API",
-            "data_type": "Live Research"
-        }
+        data = _json_loads(response.content)
+    
+    # Extract response content; an empty choices list ends up as the empty-response error
+    content = (data.get("choices") or [{}])[0].get("message", {}).get("content", "")
+    if not content:
+        raise ValueError("Empty response from Perplexity API")
+    
+    if not cached:
+        _RESPONSE_CACHE.set(cache_key, data)
+    
+    # Extract citations (Perplexity returns them in the response)
+    citations = data.get("citations", [])
+    
+    # Extract token usage (cache hits cost nothing)
+    usage = {} if cached else data.get("usage", {})
+    total_tokens = usage.get("total_tokens", 0)
+    prompt_tokens = usage.get("prompt_tokens", 0)
+    completion_tokens = usage.get("completion_tokens", 0)
+    
+    # Calculate cost
+    cost_multiplier = PERPLEXITY_MODELS[model_type]["cost_multiplier"]
+    cost = (total_tokens / 1000) * 0.002 * cost_multiplier
+    
+    # Parse findings and insights from content: first 5 bullets are findings,
+    # the next 3 are insights
+    lines = (line for line in map(str.strip, content.splitlines()) if line)
+    bullets = list(islice(
+        (match.group(1) for match in map(_BULLET_RE.match, lines) if match),
+        8
+    ))
+    findings = bullets[:5]
+    insights = bullets[5:]
+    
+    if not findings:
+        # Extract first sentences as findings
+        findings = list(islice(
+            (sentence + '.' for part in content.split('.') if len(sentence := part.strip()) > 20),
+            5
+        ))
+    
+    if not insights:
+        insights = ["Research provides valuable market intelligence",
+                   "Multiple perspectives analyzed for comprehensive view"]
+    
+    # FIXED: Create diverse sources from citations
+    if citations and len(citations) > 0:
+        # Use actual citations from Perplexity
+        search_url = f"https://www.perplexity.ai/search?q={q_plus}"
+        sources = [
+            _citation_to_source(i, citation, search_url)
+            for i, citation in enumerate(citations[:max_sources])
+        ]
+    else:
+        # Fallback: Create diverse placeholder sources
+        diverse_domains = [
+            "bloomberg.com",
+            "reuters.com", 
+            "forbes.com",
+            "wsj.com",
+            "ft.com",
+            "cnbc.com",
+            "economist.com",
+            "marketwatch.com"
+        ]
         
-    except Exception as e:
-        raise Exception(f"Perplexity API call failed: {str(e)}")
+        sources = [
+            {
+                "title": f"Research finding from {domain}",
+                "url": f"https://www.{domain}/research/{q_dash}",
+                "summary": findings[i] if i < len(findings) else f"Analysis from {domain}",
+                "agent": "Market Intelligence",
+                "source_type": "Web Research",
+                "medium": "Perplexity API"
+            }
+            for i, domain in enumerate(diverse_domains[:max_sources])
+        ]
+    
+    console_log(f"✅ Perplexity API: {total_tokens} tokens, {len(sources)} sources", "INFO")
+    
+    return {
+        "success": True,
+        "agent_name": "Market Intelligence",
+        "summary": content[:500] if content else f"Analysis of {max_sources} sources for: {query}",
+        "findings": findings[:5],
+        "insights": insights[:3],
+        "sources": sources,
+        "source_count": len(sources),
+        "sources_retrieved": len(sources),
+        "tokens": total_tokens,
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "cost": cost,
+        "status": "✅ Success (cache)" if cached else "✅ Success",
+        "model_used": model,
+        "model_type": model_type,
+        "medium": "Perplexity API",
+        "data_type": "Live Research"
+    }
 
 def execute_market_intelligence(query, model_type, max_sources, mock_mode=False):
     """
     Execute Market Intelligence agent (Perplexity)
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
+    q_short = query[:40]
     
     try:
         if mock_mode:
@@ -207,17 +302,17 @@ def execute_market_intelligence(query, model_type, max_sources, mock_mode=False)
             
             # Mock diverse sources
             diverse_domains = ["bloomberg.com", "reuters.com", "forbes.com"]
-            sources = []
-            for i in range(max_sources):
-                domain = diverse_domains[i % len(diverse_domains)]
-                sources.append({
-                    "title": f"[MOCK] {domain} - {query[:40]}",
+            sources = [
+                {
+                    "title": f"[MOCK] {domain} - {q_short}",
                     "url": f"https://www.{domain}/article-{i+1}",
                     "summary": f"Mock summary from {domain}",
                     "agent": "Market Intelligence",
                     "source_type": "Mock Data",
                     "medium": "Mock Perplexity API"
-                })
+                }
+                for i, domain in enumerate(islice(cycle(diverse_domains), max_sources))
+            ]
             
             return {
                 "success": True,
@@ -232,7 +327,7 @@ def execute_market_intelligence(query, model_type, max_sources, mock_mode=False)
                 "prompt_tokens": 450,
                 "completion_tokens": 1400,
                 "cost": 0.0037,
-                "execution_time": time.time() - start_time,
+                "execution_time": time.perf_counter() - start_time,
                 "status": "✅ Success (Mock)",
                 "model_used": PERPLEXITY_MODELS[model_type]["model"],
                 "model_type": model_type,
@@ -244,14 +339,14 @@ def execute_market_intelligence(query, model_type, max_sources, mock_mode=False)
             
             try:
                 result = call_perplexity_api_directly(query, model_type, max_sources)
-                result["execution_time"] = time.time() - start_time
+                result["execution_time"] = time.perf_counter() - start_time
                 return result
-            except Exception as api_error:
+            except (requests.RequestException, KeyError, ValueError) as api_error:
                 console_log(f"❌ Perplexity API failed: {api_error}", "ERROR")
                 return {
                     "success": False,
                     "agent_name": "Market Intelligence",
-                    "execution_time": time.time() - start_time,
+                    "execution_time": time.perf_counter() - start_time,
                     "status": "❌ API Failed",
                     "error": f"Perplexity API error: {str(api_error)}",
                     "medium": "Perplexity API",
@@ -263,16 +358,44 @@ def execute_market_intelligence(query, model_type, max_sources, mock_mode=False)
         return {
             "success": False,
             "agent_name": "Market Intelligence",
-            "execution_time": time.time() - start_time,
+            "execution_time": time.perf_counter() - start_time,
             "status": "❌ Failed",
             "error": str(e)
         }
 
+def _openrouter_completion(api_key, payload):
+    """
+    POST a chat completion to OpenRouter, serving repeat requests from the cache
+    Returns (data, cached); data is None for a non-200 reply
+    """
+    cache_key = make_cache_key(payload["model"], payload["messages"],
+                               payload.get("temperature"), payload.get("max_tokens"))
+    data = _RESPONSE_CACHE.get(cache_key)
+    if data is not None:
+        return data, True
+    
+    response = _SESSION.post(
+        "https://openrouter.ai/api/v1/chat/completions",
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        },
+        json=payload,
+        timeout=30
+    )
+    
+    if response.status_code != 200:
+        return None, False
+    
+    data = _json_loads(response.content)
+    _RESPONSE_CACHE.set(cache_key, data)
+    return data, False
+
 def summarize_with_llm(content, content_type="video"):
     """
     Summarize content using OpenRouter API (adds token costs)
     """
-    api_key = os.getenv("OPENROUTER_API_KEY")
+    api_key = _OPENROUTER_API_KEY
     if not api_key:
         # Return simple summary without LLM
         return {
@@ -282,29 +405,20 @@ def summarize_with_llm(content, content_type="video"):
         }
     
     try:
-        response = requests.post(
-            "https://openrouter.ai/api/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json"
-            },
-            json={
-                "model": "meta-llama/llama-3.1-8b-instruct:free",
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": f"Summarize this {content_type} content in 2-3 sentences:\n\n{content[:1000]}"
-                    }
-                ],
-                "max_tokens": 200
-            },
-            timeout=30
-        )
+        data, cached = _openrouter_completion(api_key, {
+            "model": "meta-llama/llama-3.1-8b-instruct:free",
+            "messages": [
+                {
+                    "role": "user",
+                    "content": f"Summarize this {content_type} content in 2-3 sentences:\n\n{content[:1000]}"
+                }
+            ],
+            "max_tokens": 200
+        })
         
-        if response.status_code == 200:
-            data = response.json()
-            summary = data.get("choices", [{}])[0].get("message", {}).get("content", content[:200])
-            usage = data.get("usage", {})
+        if data is not None:
+            summary = (data.get("choices") or [{}])[0].get("message", {}).get("content", content[:200])
+            usage = {} if cached else data.get("usage", {})
             tokens = usage.get("total_tokens", 0)
             cost = (tokens / 1000) * 0.0001  # Approximate cost
             
@@ -322,27 +436,92 @@ def summarize_with_llm(content, content_type="video"):
         "cost": 0.0
     }
 
+def summarize_many_with_llm(contents, content_type="video"):
+    """
+    Summarize several pieces of content with a single OpenRouter request
+
+    Returns one summary per input (in order) plus the combined token usage.
+    Items the model does not answer for fall back to truncated content.
+    """
+    fallback = [content[:200] + "..." for content in contents]
+    if len(contents) <= 1:
+        if not contents:
+            return {"summaries": [], "tokens": 0, "cost": 0.0}
+        result = summarize_with_llm(contents[0], content_type)
+        return {"summaries": [result["summary"]], "tokens": result["tokens"], "cost": result["cost"]}
+    
+    api_key = _OPENROUTER_API_KEY
+    if not api_key:
+        return {"summaries": fallback, "tokens": 0, "cost": 0.0}
+    
+    numbered = "\n\n".join(f"[{i}] {content[:1000]}" for i, content in enumerate(contents, 1))
+    
+    try:
+        data, cached = _openrouter_completion(api_key, {
+            "model": "meta-llama/llama-3.1-8b-instruct:free",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": (
+                        f"You will receive {len(contents)} numbered {content_type} items. "
+                        f"Summarize each in 2-3 sentences. Output exactly {len(contents)} "
+                        "summaries, one per line, each prefixed with its number in brackets, e.g. [1]."
+                    )
+                },
+                {
+                    "role": "user",
+                    "content": numbered
+                }
+            ],
+            "max_tokens": 200 * len(contents)
+        })
+        
+        if data is not None:
+            text = (data.get("choices") or [{}])[0].get("message", {}).get("content", "")
+            usage = {} if cached else data.get("usage", {})
+            tokens = usage.get("total_tokens", 0)
+            cost = (tokens / 1000) * 0.0001  # Approximate cost
+            
+            summaries = list(fallback)
+            parts = _SUMMARY_MARKER_RE.split(text)
+            for number, summary in zip(parts[1::2], parts[2::2]):
+                index = int(number) - 1
+                if 0 <= index < len(summaries) and summary.strip():
+                    summaries[index] = summary.strip()
+            
+            return {
+                "summaries": summaries,
+                "tokens": tokens,
+                "cost": cost
+            }
+    except:
+        pass
+    
+    return {"summaries": fallback, "tokens": 0, "cost": 0.0}
+
 def execute_sentiment_analytics(query, max_sources, mock_mode=False):
     """
     Execute Sentiment Analytics agent (YouTube with LLM summarization)
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
+    q_short = query[:40]
     
     try:
         if mock_mode:
             console_log("🎭 Sentiment Analytics: MOCK mode", "INFO")
             time.sleep(1.5)
             
-            sources = []
-            for i in range(max_sources):
-                sources.append({
-                    "title": f"[MOCK] Video #{i+1} - {query[:40]}",
+            sources = [
+                {
+                    "title": f"[MOCK] Video #{i+1} - {q_short}",
                     "url": f"https://youtube.com/watch?v=mock{i+1}",
-                    "summary": f"Expert analysis on {query[:40]}",
+                    "summary": f"Expert analysis on {q_short}",
                     "agent": "Sentiment Analytics",
                     "source_type": "Mock Video",
                     "medium": "Mock YouTube"
-                })
+                }
+                for i in range(max_sources)
+            ]
             
             return {
                 "success": True,
@@ -362,7 +541,7 @@ def execute_sentiment_analytics(query, max_sources, mock_mode=False):
                 "sources_retrieved": len(sources),
                 "tokens": 450,  # Mock LLM tokens
                 "cost": 0.0009,  # Mock cost
-                "execution_time": time.time() - start_time,
+                "execution_time": time.perf_counter() - start_time,
                 "status": "✅ Success (Mock)",
                 "medium": "Mock YouTube",
                 "data_type": "Mock Sentiment"
@@ -392,19 +571,24 @@ def execute_sentiment_analytics(query, max_sources, mock_mode=False):
                 
                 sources = yt_data.get("sources", [])
                 
-                # FIXED: Add LLM summarization for token costs
-                total_llm_tokens = 0
-                total_llm_cost = 0.0
-                findings = []
+                contents = [
+                    item["summary"]
+                    for source in sources[:max_sources]
+                    for item in source.get("items", [])
+                    if item.get("summary")
+                ]
                 
-                for source in sources[:max_sources]:
-                    for item in source.get("items", []):
-                        if item.get("summary"):
-                            # Summarize with LLM to add tokens
-                            llm_result = summarize_with_llm(item["summary"], "video")
-                            total_llm_tokens += llm_result["tokens"]
-                            total_llm_cost += llm_result["cost"]
-                            findings.append(llm_result["summary"][:150])
+                if _OPENROUTER_API_KEY:
+                    # FIXED: Add LLM summarization for token costs (one batched request)
+                    llm_result = summarize_many_with_llm(contents, "video")
+                    total_llm_tokens = llm_result["tokens"]
+                    total_llm_cost = llm_result["cost"]
+                    findings = [summary[:150] for summary in llm_result["summaries"]]
+                else:
+                    # No OpenRouter key - use the source summaries directly
+                    total_llm_tokens = 0
+                    total_llm_cost = 0.0
+                    findings = [content[:150] + "..." for content in contents[:5]]
                 
                 if not findings:
                     findings = [f"Analyzed {len(sources)} video sources"]
@@ -438,7 +622,7 @@ def execute_sentiment_analytics(query, max_sources, mock_mode=False):
                 return {
                     "success": False,
                     "agent_name": "Sentiment Analytics",
-                    "execution_time": time.time() - start_time,
+                    "execution_time": time.perf_counter() - start_time,
                     "status": "❌ API Failed",
                     "error": f"YouTube API error: {str(import_error)}",
                     "medium": "YouTube API",
@@ -450,7 +634,7 @@ def execute_sentiment_analytics(query, max_sources, mock_mode=False):
         return {
             "success": False,
             "agent_name": "Sentiment Analytics",
-            "execution_time": time.time() - start_time,
+            "execution_time": time.perf_counter() - start_time,
             "status": "❌ Failed",
             "error": str(e)
         }
@@ -459,31 +643,30 @@ def call_arxiv_api(query, max_results=5):
     """Call arXiv API and get papers"""
     try:
         import urllib.parse
-        import xml.etree.ElementTree as ET
         
         search_query = urllib.parse.quote(query)
         url = f"http://export.arxiv.org/api/query?search_query=all:{search_query}&start=0&max_results={max_results}"
         
-        response = requests.get(url, timeout=30)
+        response = _SESSION.get(url, timeout=30)
         response.raise_for_status()
         
-        root = ET.fromstring(response.content)
-        namespace = {'atom': 'http://www.w3.org/2005/Atom'}
-        
+        # Stream entries one at a time and free each after use
         sources = []
-        for entry in root.findall('atom:entry', namespace):
-            title = entry.find('atom:title', namespace)
-            summary = entry.find('atom:summary', namespace)
-            link = entry.find('atom:id', namespace)
+        for _, entry in etree.iterparse(BytesIO(response.content), tag=_ATOM_ENTRY_TAG,
+                                        resolve_entities=False, no_network=True):
+            title = _ATOM_TITLE_XP(entry).strip()
+            summary = _ATOM_SUMMARY_XP(entry).strip()
+            link = _ATOM_ID_XP(entry).strip()
             
             sources.append({
-                "title": title.text.strip() if title is not None and title.text is not None else "Academic Paper",
-                "url": link.text.strip() if link is not None and link.text is not None else "",
-                "summary": summary.text.strip()[:200] if summary is not None and summary.text is not None else "Research paper",
+                "title": title or "Academic Paper",
+                "url": link,
+                "summary": summary[:200] or "Research paper",
                 "agent": "Data Intelligence",
                 "source_type": "Academic",
                 "medium": "arXiv API"
             })
+            entry.clear()
         
         return sources
     except Exception as e:
@@ -494,23 +677,25 @@ def execute_data_intelligence(query, max_sources, mock_mode=False):
     """
     Execute Data Intelligence agent (arXiv with LLM summarization)
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
+    q_short = query[:40]
     
     try:
         if mock_mode:
             console_log("🎭 Data Intelligence: MOCK mode", "INFO")
             time.sleep(1.5)
             
-            sources = []
-            for i in range(max_sources):
-                sources.append({
-                    "title": f"[MOCK] Paper #{i+1} - {query[:40]}",
+            sources = [
+                {
+                    "title": f"[MOCK] Paper #{i+1} - {q_short}",
                     "url": f"https://arxiv.org/abs/mock{i+1}",
-                    "summary": f"Academic research on {query[:40]}",
+                    "summary": f"Academic research on {q_short}",
                     "agent": "Data Intelligence",
                     "source_type": "Mock Academic",
                     "medium": "Mock arXiv"
-                })
+                }
+                for i in range(max_sources)
+            ]
             
             return {
                 "success": True,
@@ -530,7 +715,7 @@ def execute_data_intelligence(query, max_sources, mock_mode=False):
                 "sources_retrieved": len(sources),
                 "tokens": 380,  # Mock LLM tokens
                 "cost": 0.00076,  # Mock cost
-                "execution_time": time.time() - start_time,
+                "execution_time": time.perf_counter() - start_time,
                 "status": "✅ Success (Mock)",
                 "medium": "Mock arXiv",
                 "data_type": "Mock Academic"
@@ -541,17 +726,19 @@ def execute_data_intelligence(query, max_sources, mock_mode=False):
             try:
                 sources = call_arxiv_api(query, max_sources)
                 
-                # FIXED: Add LLM summarization for token costs
-                total_llm_tokens = 0
-                total_llm_cost = 0.0
-                findings = []
+                contents = [source["summary"] for source in sources if source.get("summary")]
                 
-                for source in sources:
-                    if source.get("summary"):
-                        llm_result = summarize_with_llm(source["summary"], "academic paper")
-                        total_llm_tokens += llm_result["tokens"]
-                        total_llm_cost += llm_result["cost"]
-                        findings.append(llm_result["summary"][:150])
+                if _OPENROUTER_API_KEY:
+                    # FIXED: Add LLM summarization for token costs (one batched request)
+                    llm_result = summarize_many_with_llm(contents, "academic paper")
+                    total_llm_tokens = llm_result["tokens"]
+                    total_llm_cost = llm_result["cost"]
+                    findings = [summary[:150] for summary in llm_result["summaries"]]
+                else:
+                    # No OpenRouter key - use the source summaries directly
+                    total_llm_tokens = 0
+                    total_llm_cost = 0.0
+                    findings = [content[:150] + "..." for content in contents[:5]]
                 
                 if not findings:
                     findings = ["Academic sources retrieved successfully"]
@@ -572,7 +759,7 @@ def execute_data_intelligence(query, max_sources, mock_mode=False):
                     "sources_retrieved": len(sources),
                     "tokens": total_llm_tokens,  # Now has tokens from LLM
                     "cost": total_llm_cost,  # Now has cost from LLM
-                    "execution_time": time.time() - start_time,
+                    "execution_time": time.perf_counter() - start_time,
                     "status": "✅ Success",
                     "medium": "arXiv API + LLM",
                     "data_type": "Academic Research"
@@ -582,7 +769,7 @@ def execute_data_intelligence(query, max_sources, mock_mode=False):
                 return {
                     "success": False,
                     "agent_name": "Data Intelligence",
-                    "execution_time": time.time() - start_time,
+                    "execution_time": time.perf_counter() - start_time,
                     "status": "❌ API Failed",
                     "error": f"arXiv API error: {str(api_error)}",
                     "medium": "arXiv API",
@@ -594,69 +781,86 @@ def execute_data_intelligence(query, max_sources, mock_mode=False):
         return {
             "success": False,
             "agent_name": "Data Intelligence",
-            "execution_time": time.time() - start_time,
+            "execution_time": time.perf_counter() - start_time,
             "status": "❌ Failed",
             "error": str(e)
         }
 
-def execute_research(query, domain, agents, model_type, market_sources, 
-                    sentiment_sources, data_sources, progress_callback=None, mock_mode=False):
+async def _run_agent(name, func, *args, **kwargs):
+    """
+    Run a blocking agent in a worker thread, tagging the result with its name
+
+    An exception escaping the agent becomes a failed result instead of
+    cancelling the agents still running alongside it.
     """
-    Main research execution function
+    start_time = time.perf_counter()
+    try:
+        return name, await asyncio.to_thread(func, *args, **kwargs)
+    except Exception as e:
+        console_log(f"Error in {name}: {e}", "ERROR")
+        return name, {
+            "success": False,
+            "agent_name": name,
+            "execution_time": time.perf_counter() - start_time,
+            "status": "❌ Failed",
+            "error": str(e)
+        }
+
+async def execute_research_async(query, domain, agents, model_type, market_sources, 
+                                 sentiment_sources, data_sources, progress_callback=None, mock_mode=False):
+    """
+    Async research execution
+
+    Selected agents are network-bound and independent, so each runs in its own
+    thread and they overlap; progress is reported as each one finishes.
     """
     console_log(f"🚀 Research started - Mock: {mock_mode}", "INFO")
     
-    agent_results = {}
+    agent_calls = {
+        "Market Intelligence": (execute_market_intelligence, (query, model_type, market_sources)),
+        "Sentiment Analytics": (execute_sentiment_analytics, (query, sentiment_sources)),
+        "Data Intelligence": (execute_data_intelligence, (query, data_sources)),
+    }
+    selected = [name for name in agent_calls if agents.get(name, False)]
     total_agents = sum(1 for v in agents.values() if v)
     completed_agents = 0
     
-    # Market Intelligence
-    if agents.get("Market Intelligence", False):
-        if progress_callback:
-            progress_callback(0.1, "🌐 Running Market Intelligence...")
-        
-        agent_results["Market Intelligence"] = execute_market_intelligence(
-            query, model_type, market_sources, mock_mode=mock_mode
-        )
-        
-        completed_agents += 1
-        if progress_callback:
-            progress_callback(0.1 + (0.6 * completed_agents / total_agents), 
-                            f"✅ Market Intelligence complete")
-    
-    # Sentiment Analytics
-    if agents.get("Sentiment Analytics", False):
-        if progress_callback:
-            progress_callback(0.1 + (0.6 * completed_agents / total_agents), 
-                            "📊 Running Sentiment Analytics...")
-        
-        agent_results["Sentiment Analytics"] = execute_sentiment_analytics(
-            query, sentiment_sources, mock_mode=mock_mode
-        )
-        
-        completed_agents += 1
-        if progress_callback:
-            progress_callback(0.1 + (0.6 * completed_agents / total_agents), 
-                            f"✅ Sentiment Analytics complete")
-    
-    # Data Intelligence
-    if agents.get("Data Intelligence", False):
-        if progress_callback:
-            progress_callback(0.1 + (0.6 * completed_agents / total_agents), 
-                            "📈 Running Data Intelligence...")
-        
-        agent_results["Data Intelligence"] = execute_data_intelligence(
-            query, data_sources, mock_mode=mock_mode
-        )
+    if progress_callback and selected:
+        progress_callback(0.1, f"🚀 Running {', '.join(selected)}...")
+    
+    completed = {}
+    if selected:
+        progress_step = 0.6 / total_agents
+        tasks = [
+            _run_agent(name, func, *args, mock_mode=mock_mode)
+            for name, (func, args) in agent_calls.items() if name in selected
+        ]
         
-        completed_agents += 1
-        if progress_callback:
-            progress_callback(0.1 + (0.6 * completed_agents / total_agents), 
-                            f"✅ Data Intelligence complete")
+        for next_done in asyncio.as_completed(tasks):
+            name, result = await next_done
+            completed[name] = result
+            
+            completed_agents += 1
+            if progress_callback:
+                progress_callback(0.1 + progress_step * completed_agents, f"✅ {name} complete")
+    
+    # Keep results in the fixed agent order regardless of finish order
+    agent_results = {name: completed[name] for name in selected}
     
     if progress_callback:
         progress_callback(0.8, "📊 Consolidating results...")
     
     console_log(f"✅ Research complete - {completed_agents}/{total_agents} agents", "INFO")
     
-    return agent_results
\ No newline at end of file
+    return agent_results
+
+def execute_research(query, domain, agents, model_type, market_sources, 
+                    sentiment_sources, data_sources, progress_callback=None, mock_mode=False):
+    """
+    Main research execution function (sync wrapper around execute_research_async)
+    """
+    return asyncio.run(execute_research_async(
+        query, domain, agents, model_type, market_sources,
+        sentiment_sources, data_sources,
+        progress_callback=progress_callback, mock_mode=mock_mode
+    ))
@@ -4,7 +4,8 @@ Handles all results visualization with proper source structure handling
 """
 
 import streamlit as st
-import json
+from html import escape
+from collections import defaultdict
 from datetime import datetime
 import pandas as pd
 import os
@@ -16,6 +17,55 @@ except ImportError:
     MATPLOTLIB_AVAILABLE = False
 
 from utils import generate_comprehensive_pdf, PDF_AVAILABLE
+from utils.fast_json import dumps
+
+# Overview table: agent_data key -> column label, and defaults for missing keys
+OVERVIEW_COLUMNS = {
+    'agent_name': "Agent",
+    'status': "Status",
+    'source_count': "Sources",
+    'findings_count': "Findings",
+    'insights_count': "Insights",
+    'tokens': "Tokens",
+    'cost': "Cost",
+    'execution_time': "Time",
+    'medium': "Medium",
+}
+OVERVIEW_DEFAULTS = {
+    'agent_name': 'Unknown',
+    'status': 'Unknown',
+    'source_count': 0,
+    'findings_count': 0,
+    'insights_count': 0,
+    'tokens': 0,
+    'cost': 0,
+    'execution_time': 0,
+    'medium': 'N/A',
+}
+
+# Card templates (kept unindented so they can be joined into one markdown block)
+FINDING_CARD_HTML = (
+    '<div class="finding-card">'
+    '<span style="color: #f97316; font-weight: 700; margin-right: 0.75rem; font-size: 1.1rem;">{idx}.</span>'
+    '<span style="color: #334155; line-height: 1.7;">{text}</span>'
+    '</div>'
+)
+INSIGHT_PILL_HTML = (
+    '<div style="display: inline-block; background: linear-gradient(135deg, #0ea5e9 0%, #0284c7 100%); color: white; padding: 0.75rem 1.25rem; border-radius: 24px; margin: 0.5rem 0.5rem 0.5rem 0; font-size: 0.95rem; font-weight: 500; box-shadow: 0 2px 8px rgba(14, 165, 233, 0.2);">'
+    '✓ {text}'
+    '</div>'
+)
+SOURCE_CARD_HTML = (
+    '<div style="background: white; border-radius: 8px; padding: 1.25rem; margin-bottom: 1rem; border: 1px solid #e2e8f0; box-shadow: 0 1px 2px rgba(0,0,0,0.05);">'
+    '<div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 0.5rem;">'
+    '<div style="font-weight: 600; color: #0ea5e9; flex: 1;">{idx}. {title}</div>'
+    '<span style="background: #e0f2fe; color: #0284c7; padding: 0.25rem 0.75rem; border-radius: 12px; font-size: 0.75rem; white-space: nowrap; margin-left: 1rem;">{source_type}</span>'
+    '</div>'
+    '<div style="color: #64748b; font-size: 0.85rem; margin-bottom: 0.5rem;">📡 Medium: {medium}</div>'
+    '<a href="{url}" target="_blank" style="color: #64748b; font-size: 0.85rem; word-break: break-all;">🔗 {url_display}</a>'
+    '<div style="color: #475569; margin-top: 0.5rem; font-size: 0.9rem;">{summary}</div>'
+    '</div>'
+)
 
 def flatten_sources(sources):
     """
@@ -24,35 +74,84 @@ def flatten_sources(sources):
     """
     flattened = []
     
+    append = flattened.append
+    
     for source in sources:
+        get = source.get
         # Check if source has 'items' (nested structure from build_structured_record)
         if isinstance(source, dict) and 'items' in source:
+            # Fields shared by every item of this source are looked up once
+            has_agent_name = 'agent_name' in source
+            agent_name = get('agent_name')
+            source_type = get('source_name', 'Web Research')
+            meta = get('metadata') or {}
+            medium = meta.get('medium', 'N/A')
+            
             # Extract items from nested structure
-            for item in source.get('items', []):
-                flattened.append({
-                    'title': item.get('title', 'Unknown'),
-                    'url': item.get('source', item.get('url', '#')),
-                    'summary': item.get('summary', 'No description'),
-                    'agent': source.get('agent_name', item.get('authors', ['Unknown'])[0] if item.get('authors') else 'Unknown'),
-                    'source_type': source.get('source_name', 'Web Research'),
-                    'medium': source.get('metadata', {}).get('medium', 'N/A') if 'metadata' in source else 'N/A'
+            for item in get('items', []):
+                item_get = item.get
+                agent = agent_name
+                if not has_agent_name:
+                    authors = item_get('authors')
+                    agent = authors[0] if authors else 'Unknown'
+                append({
+                    'title': item_get('title', 'Unknown'),
+                    'url': item_get('source', item_get('url', '#')),
+                    'summary': item_get('summary', 'No description'),
+                    'agent': agent,
+                    'source_type': source_type,
+                    'medium': medium
                 })
         else:
             # Already flat structure
-            flattened.append({
-                'title': source.get('title', 'Unknown'),
-                'url': source.get('url', '#'),
-                'summary': source.get('summary', 'No description'),
-                'agent': source.get('agent', 'Unknown'),
-                'source_type': source.get('source_type', 'Unknown'),
-                'medium': source.get('medium', 'N/A')
+            append({
+                'title': get('title', 'Unknown'),
+                'url': get('url', '#'),
+                'summary': get('summary', 'No description'),
+                'agent': get('agent', 'Unknown'),
+                'source_type': get('source_type', 'Unknown'),
+                'medium': get('medium', 'N/A')
             })
     
     return flattened
 
+def get_flattened_sources(results):
+    """
+    Flatten results['sources'] once per results object
+    The results dict lives in session state, so reruns reuse the cached list
+    """
+    sources = results.get('sources', [])
+    # Holding the sources list itself keeps its id from being reused by a later run
+    cached = st.session_state.get('_flattened_sources')
+    if cached and cached[0] is sources and cached[1] == len(sources):
+        return cached[2]
+    
+    flattened = flatten_sources(sources)
+    st.session_state['_flattened_sources'] = (sources, len(sources), flattened)
+    return flattened
+
+def get_results_json(results):
+    """
+    Serialize results for the JSON download once per results object
+    """
+    # Holding the results dict itself keeps its id from being reused by a later run
+    cached = st.session_state.get('_results_json')
+    if cached and cached[0] is results:
+        return cached[1]
+    
+    results_json = dumps(results, indent=True)
+    
+    st.session_state['_results_json'] = (results, results_json)
+    return results_json
+
 def display_results(results):
     """Display comprehensive research results"""
     
+    # Count what the Sources view lists (cached), not the agents' self-reported totals
+    all_sources = get_flattened_sources(results)
+    total_sources = len(all_sources)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    
     st.markdown("---")
     st.markdown("## 📊 Research Results")
     
@@ -84,12 +183,11 @@ def display_results(results):
         """, unsafe_allow_html=True)
     
     with col4:
-        # FIXED: Flatten sources before counting
-        all_sources = flatten_sources(results.get('sources', []))
+        # Counted once above and shared with the statistics view
         st.markdown(f"""
         <div class="metric-card">
             <div class="metric-label">Sources</div>
-            <div class="metric-value">{len(all_sources)}</div>
+            <div class="metric-value">{total_sources}</div>
         </div>
         """, unsafe_allow_html=True)
     
@@ -108,8 +206,8 @@ def display_results(results):
     col1, col2 = st.columns(2)
     
     with col1:
-        results_json = json.dumps(results, indent=2, ensure_ascii=False)
-        json_filename = f"luminar_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        results_json = get_results_json(results)
+        json_filename = f"luminar_results_{timestamp}.json"
         st.download_button(
             "📥 Download Results JSON",
             results_json,
@@ -120,14 +218,20 @@ def display_results(results):
         )
     
     with col2:
-        pdf_filename = f"luminar_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        pdf_filename = f"luminar_report_{timestamp}.pdf"
         if PDF_AVAILABLE:
             try:
-                pdf_buffer = generate_comprehensive_pdf(results)
-                if pdf_buffer:
+                # Build the PDF only on request; keep it for later reruns of the same results
+                cached_pdf = st.session_state.get('_pdf_buffer')
+                # The results dict is held, not its id, so a later run can't match a stale PDF
+                if not cached_pdf or cached_pdf[0] is not results:
+                    if st.button("📄 Generate PDF Report", width='stretch', key="generate_pdf_btn"):
+                        st.session_state['_pdf_buffer'] = (results, generate_comprehensive_pdf(results))
+                        st.rerun()
+                elif cached_pdf[1]:
                     st.download_button(
                         "📄 Download PDF Report",
-                        pdf_buffer,
+                        cached_pdf[1],
                         pdf_filename,
                         "application/pdf",
                         width='stretch',
@@ -140,33 +244,32 @@ def display_results(results):
         else:
             st.button("📄 PDF Unavailable", disabled=True, width='stretch')
     
-    # TABS
-    tabs = st.tabs([
-        "📊 Overview", 
-        "📋 Summary", 
-        "🔍 Findings", 
-        "💡 Insights", 
-        "🔗 Sources",
-        "📈 Statistics"
-    ])
-    
-    with tabs[0]:
-        display_overview_tab(results)
-    
-    with tabs[1]:
-        display_summary_tab(results)
-    
-    with tabs[2]:
-        display_findings_tab(results)
-    
-    with tabs[3]:
-        display_insights_tab(results)
-    
-    with tabs[4]:
-        display_sources_tab(results)
-    
-    with tabs[5]:
-        display_statistics_tab(results)
+    # TABS: only the selected view is rendered on each rerun (st.tabs runs every body)
+    views = {
+        "📊 Overview": display_overview_tab,
+        "📋 Summary": display_summary_tab,
+        "🔍 Findings": display_findings_tab,
+        "💡 Insights": display_insights_tab,
+        "🔗 Sources": lambda res: display_sources_tab(res, all_sources),
+        "📈 Statistics": lambda res: display_statistics_tab(res, total_sources),
+    }
+    selected_view = st.radio(
+        "View",
+        list(views),
+        horizontal=True,
+        key="results_tab",
+        label_visibility="collapsed"
+    )
+    views[selected_view](results)
+
+def build_agent_frame(agent_data):
+    """Create a DataFrame straight from the agent records, filling missing fields"""
+    return (
+        pd.DataFrame.from_records(agent_data)
+        .reindex(columns=list(OVERVIEW_COLUMNS))
+        .fillna(OVERVIEW_DEFAULTS)
+        .astype({key: int for key in ('source_count', 'findings_count', 'insights_count', 'tokens')})
+    )
 
 def display_overview_tab(results):
     """Display analysis overview"""
@@ -174,31 +277,17 @@ def display_overview_tab(results):
     
     agent_data = results.get('agent_data', [])
     if agent_data:
-        df_data = []
-        for agent in agent_data:
-            df_data.append({
-                "Agent": agent.get('agent_name', 'Unknown'),
-                "Status": agent.get('status', 'Unknown'),
-                "Sources": agent.get('source_count', 0),
-                "Findings": agent.get('findings_count', 0),
-                "Insights": agent.get('insights_count', 0),
-                "Tokens": agent.get('tokens', 0),
-                "Cost": agent.get('cost', 0),
-                "Time": f"{agent.get('execution_time', 0):.2f}s",
-                "Medium": agent.get('medium', 'N/A')
-            })
+        df = build_agent_frame(agent_data).rename(columns=OVERVIEW_COLUMNS)
         
-        # Create DataFrame
-        df = pd.DataFrame(df_data)
-        
-        # Format cost column
-        df['Cost'] = df['Cost'].apply(lambda x: f"${x:.4f}")
-        
-        # Display table
+        # Display table (cost/time formatted by the column config, not per row)
         st.dataframe(
             df,
             width='stretch',
-            hide_index=True
+            hide_index=True,
+            column_config={
+                "Cost": st.column_config.NumberColumn(format="$%.4f"),
+                "Time": st.column_config.NumberColumn(format="%.2fs"),
+            }
         )
     else:
         st.warning("No agent performance data available")
@@ -238,15 +327,12 @@ def display_findings_tab(results):
     findings = results.get('key_findings', [])
     
     if findings:
+        html_parts = []
         for idx, finding in enumerate(findings, 1):
             clean = finding.strip() if isinstance(finding, str) else str(finding)
             if clean:
-                st.markdown(f"""
-                <div class="finding-card">
-                    <span style="color: #f97316; font-weight: 700; margin-right: 0.75rem; font-size: 1.1rem;">{idx}.</span>
-                    <span style="color: #334155; line-height: 1.7;">{clean}</span>
-                </div>
-                """, unsafe_allow_html=True)
+                html_parts.append(FINDING_CARD_HTML.format(idx=idx, text=clean))
+        st.markdown("".join(html_parts), unsafe_allow_html=True)
     else:
         st.info("No key findings available")
 
@@ -256,67 +342,61 @@ def display_insights_tab(results):
     insights = results.get('insights', [])
     
     if insights:
+        html_parts = []
         for insight in insights:
             clean = insight.strip() if isinstance(insight, str) else str(insight)
             if clean:
-                st.markdown(f"""
-                <div style="display: inline-block; background: linear-gradient(135deg, #0ea5e9 0%, #0284c7 100%); color: white; padding: 0.75rem 1.25rem; border-radius: 24px; margin: 0.5rem 0.5rem 0.5rem 0; font-size: 0.95rem; font-weight: 500; box-shadow: 0 2px 8px rgba(14, 165, 233, 0.2);">
-                    ✓ {clean}
-                </div>
-                """, unsafe_allow_html=True)
+                html_parts.append(INSIGHT_PILL_HTML.format(text=clean))
+        st.markdown("".join(html_parts), unsafe_allow_html=True)
     else:
         st.info("No strategic insights available")
 
-def display_sources_tab(results):
+def display_sources_tab(results, all_sources=None):
     """
     Display all sources - FIXED to handle nested structures
     """
     st.markdown('<div class="section-title">🔗 Research Sources</div>', unsafe_allow_html=True)
     
     # FIXED: Flatten sources first
-    all_sources = flatten_sources(results.get('sources', []))
+    if all_sources is None:
+        all_sources = get_flattened_sources(results)
     
     # Group by agent
-    sources_by_agent = {}
+    sources_by_agent = defaultdict(list)
     for source in all_sources:
-        agent = source.get('agent', 'Unknown')
-        if agent not in sources_by_agent:
-            sources_by_agent[agent] = []
-        sources_by_agent[agent].append(source)
+        sources_by_agent[source.get('agent', 'Unknown')].append(source)
     
     if sources_by_agent:
+        # Render every source in one markdown element instead of one per card
+        html_parts = []
         for agent_name, sources in sources_by_agent.items():
-            st.markdown(f"#### {agent_name} ({len(sources)} sources)")
+            html_parts.append(f"\n\n#### {escape(str(agent_name))} ({len(sources)} sources)\n\n")
             
             for idx, source in enumerate(sources, 1):
-                title = source.get('title', 'Unknown')
-                source_type = source.get('source_type', 'Unknown')
-                medium = source.get('medium', 'N/A')
+                # Source text is escaped before it goes into the card HTML
+                title = escape(str(source.get('title', 'Unknown')))
+                source_type = escape(str(source.get('source_type', 'Unknown')))
+                medium = escape(str(source.get('medium', 'N/A')))
                 url = source.get('url', '#')
-                summary = source.get('summary', 'No description')
+                summary = escape(str(source.get('summary', 'No description')))
                 
                 # Clean up N/A values
                 if not url or url == '#' or url == 'N/A':
                     url = '#'
                     url_display = 'URL not available'
                 else:
-                    url_display = url
+                    url = url_display = escape(str(url))
                 
-                st.markdown(f"""
-                <div style="background: white; border-radius: 8px; padding: 1.25rem; margin-bottom: 1rem; border: 1px solid #e2e8f0; box-shadow: 0 1px 2px rgba(0,0,0,0.05);">
-                    <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 0.5rem;">
-                        <div style="font-weight: 600; color: #0ea5e9; flex: 1;">{idx}. {title}</div>
-                        <span style="background: #e0f2fe; color: #0284c7; padding: 0.25rem 0.75rem; border-radius: 12px; font-size: 0.75rem; white-space: nowrap; margin-left: 1rem;">{source_type}</span>
-                    </div>
-                    <div style="color: #64748b; font-size: 0.85rem; margin-bottom: 0.5rem;">📡 Medium: {medium}</div>
-                    <a href="{url}" target="_blank" style="color: #64748b; font-size: 0.85rem; word-break: break-all;">🔗 {url_display}</a>
-                    <div style="color: #475569; margin-top: 0.5rem; font-size: 0.9rem;">{summary}</div>
-                </div>
-                """, unsafe_allow_html=True)
+                html_parts.append(SOURCE_CARD_HTML.format(
+                    idx=idx, title=title, source_type=source_type, medium=medium,
+                    url=url, url_display=url_display, summary=summary
+                ))
+        
+        st.markdown("".join(html_parts), unsafe_allow_html=True)
     else:
         st.info("No sources available")
 
-def display_statistics_tab(results):
+def display_statistics_tab(results, total_sources=None):
     """Display comprehensive statistics"""
     st.markdown('<div class="section-title">📈 Comprehensive Statistics</div>', unsafe_allow_html=True)
     
@@ -326,53 +406,48 @@ def display_statistics_tab(results):
         # Overall statistics
         st.markdown("### 📊 Overall Performance Metrics")
         
+        df = build_agent_frame(agent_data)
+        totals = df[['source_count', 'findings_count', 'insights_count']].sum()
+        if total_sources is None:
+            total_sources = len(get_flattened_sources(results))
+        
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            total_sources = sum(a.get('source_count', 0) for a in agent_data)
             st.metric("Total Sources", total_sources)
         
         with col2:
-            total_findings = sum(a.get('findings_count', 0) for a in agent_data)
-            st.metric("Total Findings", total_findings)
+            st.metric("Total Findings", int(totals['findings_count']))
         
         with col3:
-            total_insights = sum(a.get('insights_count', 0) for a in agent_data)
-            st.metric("Total Insights", total_insights)
+            st.metric("Total Insights", int(totals['insights_count']))
         
         with col4:
-            avg_time = sum(a.get('execution_time', 0) for a in agent_data) / len(agent_data)
-            st.metric("Avg Time/Agent", f"{avg_time:.2f}s")
+            st.metric("Avg Time/Agent", f"{df['execution_time'].mean():.2f}s")
         
         st.markdown("---")
         
         # Token Usage Breakdown
         st.markdown("### 🎫 Token Usage Breakdown")
         
-        for agent in agent_data:
-            if agent.get('tokens', 0) > 0:
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    st.write(f"**{agent.get('agent_name')}**")
-                
-                with col2:
-                    prompt_tokens = agent.get('prompt_tokens', 0)
-                    completion_tokens = agent.get('completion_tokens', 0)
-                    total_tokens = agent.get('tokens', prompt_tokens + completion_tokens)
-                    st.write(f"Total: {total_tokens:,}")
-                
-                with col3:
-                    cost = agent.get('cost', 0)
-                    st.write(f"Cost: ${cost:.4f}")
+        token_df = df.loc[df['tokens'] > 0, ['agent_name', 'tokens', 'cost']]
+        if not token_df.empty:
+            st.dataframe(
+                token_df.rename(columns={'agent_name': "Agent", 'tokens': "Tokens", 'cost': "Cost"}),
+                width='stretch',
+                hide_index=True,
+                column_config={
+                    "Cost": st.column_config.NumberColumn(format="$%.4f"),
+                }
+            )
         
         st.markdown("---")
         
         # Performance Summary
         st.markdown("### ⚡ Performance Summary")
         
-        success_count = sum(1 for a in agent_data if 'Success' in a.get('status', ''))
-        total_agents = len(agent_data)
+        success_count = int(df['status'].str.contains('Success', regex=False).sum())
+        total_agents = len(df)
         success_rate = (success_count / total_agents * 100) if total_agents > 0 else 0
         
         st.progress(success_rate / 100)
@@ -8,9 +8,9 @@ import sys
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment from .env file
+# Load environment from .env file; values already set in the shell take precedence
 env_file = Path(__file__).parent / '.env'
-load_dotenv(env_file)
+load_dotenv(env_file, override=False, interpolate=False)
 
 # Verify API key is loaded
 api_key = os.getenv("PERPLEXITY_API_KEY")
@@ -5,28 +5,51 @@ services/perplexity_client.py
 """
 from __future__ import annotations
 
+import asyncio
 import re
 import time
 from typing import Any, Dict, Iterable, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson decodes the response bytes directly; stdlib json also accepts bytes
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 _DEFAULT_BASE_URL = "https://api.perplexity.ai"
 _DEFAULT_MODEL = "sonar-pro"
 _DEFAULT_TIMEOUT = 120  # Original working timeout
 _BULLET_MARKERS = ("-", "*", "\u2022", "\u2023", "\u00b7")
+# Leading bullet characters followed by any list numbering ("- 1. ", "2) ", "• ")
+_BULLET_PREFIX_RE = re.compile(r"^[-*\t \u2022\u2023\u00b7]*[0-9. )\-\u2022\u2023\u00b7]*")
+
+# Section header markers, listed in the order they take precedence
+_SECTION_MARKERS = {
+    "summary": ("executive summary", "summary:", "## summary"),
+    "findings": ("key finding", "findings:", "## findings"),
+    "insights": ("insight", "key insight", "## insights"),
+    "next_steps": ("next step", "recommendations:", "## next steps"),
+}
+_SECTION_MAP = {marker: section for section, markers in _SECTION_MARKERS.items() for marker in markers}
+_SECTION_ORDER = {section: rank for rank, section in enumerate(_SECTION_MARKERS)}
+_SECTION_RE = re.compile("|".join(
+    re.escape(marker) for marker in sorted(_SECTION_MAP, key=len, reverse=True)
+))
 
 
 def _safe_text(response: requests.Response) -> str:
     try:
-        return response.text[:500]
+        return response.content[:500].decode("utf-8", errors="replace")
     except Exception:
         return ""
 
 
 def _strip_bullet_prefix(value: str) -> str:
-    stripped = value.lstrip("-*\t \u2022\u2023\u00b7")
-    return stripped.lstrip("0123456789. )-\u2022\u2023\u00b7")
+    return _BULLET_PREFIX_RE.sub("", value, count=1)
 
 
 class PerplexityClient:
@@ -48,6 +71,18 @@ class PerplexityClient:
         self.base_url = base_url.rstrip("/")
         self.model = model
 
+        # One keep-alive session per client so repeat calls skip the TCP/TLS handshake
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=(429, 500, 502, 503, 504)),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update(self._headers)
+
     def deep_search(
         self,
         query: str,
@@ -57,6 +92,7 @@ class PerplexityClient:
         max_tokens: int = 2000,
         temperature: float = 0.2,
         top_p: float = 0.9,
+        return_images: bool = False,
     ) -> Dict[str, Any]:
         """Execute a Perplexity deep-search styled chat completion."""
         
@@ -70,13 +106,15 @@ class PerplexityClient:
             "temperature": temperature,
             "top_p": top_p,
             "return_citations": True,
-            "return_images": False,
         }
+        # Images are off by default on the API side, so the flag is only sent when enabled
+        if return_images:
+            payload["return_images"] = True
 
         url = f"{self.base_url}/chat/completions"
         start = time.perf_counter()
         try:
-            response = requests.post(url, headers=self._headers, json=payload, timeout=_DEFAULT_TIMEOUT)
+            response = self._session.post(url, json=payload, timeout=_DEFAULT_TIMEOUT)
         except requests.RequestException as exc:
             duration = time.perf_counter() - start
             return {
@@ -97,7 +135,7 @@ class PerplexityClient:
             }
 
         try:
-            result = response.json()
+            result = _json_loads(response.content)
         except ValueError:
             return {
                 "success": False,
@@ -111,6 +149,20 @@ class PerplexityClient:
         parsed["duration"] = duration
         return parsed
 
+    async def deep_search_async(self, query: str, system_prompt: str, **kwargs: Any) -> Dict[str, Any]:
+        """Run deep_search in a worker thread so several calls can overlap."""
+        return await asyncio.to_thread(self.deep_search, query, system_prompt, **kwargs)
+
+    def deep_search_many(self, queries: Iterable[str], system_prompt: str, **kwargs: Any) -> List[Dict[str, Any]]:
+        """Execute several deep searches concurrently; results follow the order of queries."""
+
+        async def _gather() -> List[Dict[str, Any]]:
+            return await asyncio.gather(
+                *(self.deep_search_async(query, system_prompt, **kwargs) for query in queries)
+            )
+
+        return asyncio.run(_gather())
+
     def _parse_response(self, result: Dict[str, Any], *, query: str, domain: str) -> Dict[str, Any]:
         choices = result.get("choices") or []
         if not choices:
@@ -176,35 +228,42 @@ class PerplexityClient:
             "analysis": content
         }
 
-        lines = content.split("\n")
         current_section = None
         buffer: List[str] = []
-
-        for line in lines:
-            line_lower = line.lower().strip()
+        # Bullet lines anywhere in the content, used as findings if no section is found
+        bullet_candidates: List[str] = []
+
+        for line in content.split("\n"):
+            stripped = line.strip()
+            line_lower = stripped.lower()
+            if stripped.startswith(_BULLET_MARKERS):
+                bullet_candidates.append(stripped)
             
             # Detect section headers
-            if any(marker in line_lower for marker in ["executive summary", "summary:", "## summary"]):
+            markers = _SECTION_RE.findall(line_lower)
+            section = min(map(_SECTION_MAP.__getitem__, markers), key=_SECTION_ORDER.__getitem__) if markers else None
+
+            if section == "summary":
                 if current_section and buffer:
                     sections[current_section] = "\n".join(buffer).strip()
                 current_section = "summary"
                 buffer = []
                 continue
-            elif any(marker in line_lower for marker in ["key finding", "findings:", "## findings"]):
+            elif section == "findings":
                 if current_section and buffer:
                     if current_section == "summary":
                         sections["summary"] = "\n".join(buffer).strip()
                     buffer = []
                 current_section = "findings"
                 continue
-            elif any(marker in line_lower for marker in ["insight", "key insight", "## insights"]):
+            elif section == "insights":
                 if current_section and buffer:
                     if current_section == "findings":
                         sections["findings"] = [_strip_bullet_prefix(b) for b in buffer if b.strip()]
                     buffer = []
                 current_section = "insights"
                 continue
-            elif any(marker in line_lower for marker in ["next step", "recommendations:", "## next steps"]):
+            elif section == "next_steps":
                 if current_section and buffer:
                     if current_section == "insights":
                         sections["insights"] = [_strip_bullet_prefix(b) for b in buffer if b.strip()]
@@ -213,8 +272,8 @@ class PerplexityClient:
                 continue
 
             # Add content to buffer
-            if current_section and line.strip():
-                buffer.append(line.strip())
+            if current_section and stripped:
+                buffer.append(stripped)
 
         # Handle remaining buffer
         if current_section and buffer:
@@ -226,19 +285,17 @@ class PerplexityClient:
         # Fallback if no structured sections found
         if not sections["summary"]:
             # Take first few sentences as summary
-            sentences = content.split(". ")[:3]
+            sentences = content.split(". ", 3)[:3]
             sections["summary"] = ". ".join(sentences).strip() + "." if sentences else ""
 
         if not sections["findings"]:
             # Extract bullet points as findings
-            for line in lines:
-                stripped = line.strip()
-                if any(stripped.startswith(marker) for marker in _BULLET_MARKERS):
-                    finding = _strip_bullet_prefix(stripped)
-                    if len(finding) > 20:  # Only substantial findings
-                        sections["findings"].append(finding)
-                        if len(sections["findings"]) >= 5:
-                            break
+            for candidate in bullet_candidates:
+                finding = _strip_bullet_prefix(candidate)
+                if len(finding) > 20:  # Only substantial findings
+                    sections["findings"].append(finding)
+                    if len(sections["findings"]) >= 5:
+                        break
 
         return sections
 
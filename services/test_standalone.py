@@ -37,6 +37,24 @@ try:
     # Test 3: Direct API call without any custom classes
     print("\n[3] Making direct API call...", flush=True)
     
+    # One pooled session for every request the script makes (reuses the TLS connection)
+    _SESSION = None
+    
+    async def _get_session():
+        global _SESSION
+        if _SESSION is None or _SESSION.closed:
+            _SESSION = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=75)
+            )
+        return _SESSION
+    
+    async def main():
+        try:
+            return await test_api()
+        finally:
+            if _SESSION is not None:
+                await _SESSION.close()
+    
     async def test_api():
         print("    → Creating session...", flush=True)
         
@@ -60,25 +78,25 @@ try:
         print(f"       Model: {payload['model']}", flush=True)
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=payload, timeout=30) as resp:
-                    print(f"    → Status: {resp.status}", flush=True)
+            session = await _get_session()
+            async with session.post(url, headers=headers, json=payload, timeout=30) as resp:
+                print(f"    → Status: {resp.status}", flush=True)
+                
+                if resp.status == 200:
+                    result = await resp.json()
+                    content = result["choices"][0]["message"]["content"]
+                    tokens = result["usage"]["total_tokens"]
+                    
+                    print("\n    ✅ SUCCESS!", flush=True)
+                    print(f"    Response: {content}", flush=True)
+                    print(f"    Tokens: {tokens}", flush=True)
+                    return True
+                else:
+                    text = await resp.text()
+                    print(f"\n    ❌ FAILED", flush=True)
+                    print(f"    Error: {text[:200]}", flush=True)
+                    return False
                     
-                    if resp.status == 200:
-                        result = await resp.json()
-                        content = result["choices"][0]["message"]["content"]
-                        tokens = result["usage"]["total_tokens"]
-                        
-                        print("\n    ✅ SUCCESS!", flush=True)
-                        print(f"    Response: {content}", flush=True)
-                        print(f"    Tokens: {tokens}", flush=True)
-                        return True
-                    else:
-                        text = await resp.text()
-                        print(f"\n    ❌ FAILED", flush=True)
-                        print(f"    Error: {text[:200]}", flush=True)
-                        return False
-                        
         except asyncio.TimeoutError:
             print("    ❌ Request timed out", flush=True)
             return False
@@ -98,7 +116,7 @@ try:
             asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
             print("    ℹ️  Using Windows event loop policy", flush=True)
         
-        success = asyncio.run(test_api())
+        success = asyncio.run(main())
         
         if success:
             print("\n" + "="*60, flush=True)
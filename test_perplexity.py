@@ -19,6 +19,7 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from agents.perplexity_agent import PerplexityAgent
+from utils.http import close_async_session
 from dotenv import load_dotenv
 
 async def test_perplexity():
@@ -63,19 +64,36 @@ async def test_perplexity():
     
     results = []
     
-    for idx, test in enumerate(test_cases, 1):
+    # Run all cases concurrently; the semaphore caps in-flight API calls
+    sem = asyncio.Semaphore(4)
+    
+    async def run_case(test):
+        async with sem:
+            return await agent.execute(
+                query=test['query'],
+                domain=test['domain'],
+                max_tokens=test['max_tokens']
+            )
+    
+    print(f"\n⏳ Executing {len(test_cases)} tests concurrently (may take 10-30 seconds)...")
+    try:
+        results_raw = await asyncio.gather(
+            *(run_case(test) for test in test_cases),
+            return_exceptions=True
+        )
+    finally:
+        # Release the pooled aiohttp session before asyncio.run closes the loop
+        await close_async_session()
+    
+    for idx, (test, result) in enumerate(zip(test_cases, results_raw), 1):
         print(f"\n{'='*70}")
         print(f"TEST {idx}: {test['domain'].upper()} Domain")
         print(f"{'='*70}")
         print(f"Query: {test['query']}")
-        print(f"\n⏳ Executing (may take 10-30 seconds)...")
         
         try:
-            result = await agent.execute(
-                query=test['query'],
-                domain=test['domain'],
-                max_tokens=test['max_tokens']
-            )
+            if isinstance(result, BaseException):
+                raise result
             
             if result.get('success'):
                 print(f"\n✅ SUCCESS!")
@@ -117,7 +135,7 @@ async def test_perplexity():
                 # Save full result
                 filename = f"result_{idx}_{test['domain']}.json"
                 with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(result, f, indent=2)
+                    json.dump(result, f, indent=2, default=str)
                 print(f"\n💾 Full result saved: {filename}")
                 
                 results.append(result)
@@ -129,10 +147,6 @@ async def test_perplexity():
             print(f"\n❌ Exception: {e}")
             import traceback
             traceback.print_exc()
-        
-        # Wait between requests
-        if idx < len(test_cases):
-            await asyncio.sleep(2)
     
     # Summary
     print(f"\n{'='*70}")
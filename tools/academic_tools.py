@@ -1,6 +1,10 @@
 """Academic research helper tools used by the agent suite."""
 from __future__ import annotations
 
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
 from langchain_community.tools import ArxivQueryRun, DuckDuckGoSearchRun
@@ -8,6 +12,11 @@ from langchain_community.utilities.arxiv import ArxivAPIWrapper
 
 from utils.structured_data import build_structured_record
 
+try:
+    import fitz  # PyMuPDF, only needed for full-text extraction
+except ImportError:  # pragma: no cover - optional dependency
+    fitz = None
+
 __all__ = ["arxiv_tool", "scholar_search", "fetch_arxiv_structured"]
 
 # Provide a high-level arXiv wrapper that returns full metadata for downstream processing.
@@ -20,35 +29,73 @@ scholar_search = DuckDuckGoSearchRun(
 )
 
 
-def fetch_arxiv_structured(query: str, max_results: int) -> Tuple[List[Dict[str, Any]], str | None]:
-    """Return arXiv papers as unified structured records."""
-    wrapper = ArxivAPIWrapper(
+# Cached arXiv results are reused within this window (seconds)
+_ARXIV_CACHE_TTL = 600
+
+
+class _ArxivFetchError(Exception):
+    """Raised inside the cached fetch so failures are not memoized."""
+
+
+def _new_wrapper(max_results: int) -> ArxivAPIWrapper:
+    return ArxivAPIWrapper(
         top_k_results=max_results,
         load_all_available_meta=True,
         continue_on_failure=True,
         doc_content_chars_max=None,
     )
+
+
+def _pdf_text(result: Any) -> str:
+    """Download one paper's PDF into a scratch directory and return its text."""
     try:
-        search_results = list(wrapper._fetch_results(query))  # type: ignore[attr-defined]
-    except Exception as exc:  # pragma: no cover - third-party failure
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with fitz.open(result.download_pdf(dirpath=tmp_dir)) as pdf:
+                return "".join(page.get_text() for page in pdf)
+    except Exception:  # pragma: no cover - network/parse failure for a single paper
+        return ""
+
+
+def _load_fulltext(search_results: List[Any]) -> Dict[str, str]:
+    """Map paper titles to full text, downloading the PDFs in parallel."""
+    if fitz is None:
+        return {}
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        texts = executor.map(_pdf_text, search_results)
+        return {
+            getattr(result, "title", ""): text
+            for result, text in zip(search_results, texts)
+            if text
+        }
+
+
+def fetch_arxiv_structured(
+    query: str, max_results: int, *, fetch_fulltext: bool = False
+) -> Tuple[List[Dict[str, Any]], str | None]:
+    """Return arXiv papers as unified structured records.
+
+    Records carry the abstract as content; with ``fetch_fulltext`` each paper's
+    PDF is downloaded and parsed instead (slow, requires PyMuPDF).
+    """
+    try:
+        records = _fetch_arxiv_records(
+            query, max_results, fetch_fulltext, int(time.time() // _ARXIV_CACHE_TTL)
+        )
+    except _ArxivFetchError as exc:
         return [], str(exc)
+    # Copy so callers can't mutate the cached records
+    return [dict(record) for record in records], None
 
-    # Attempt to fetch full text where available so downstream summarisation has richer context.
-    content_map: Dict[str, str] = {}
-    if search_results:
-        try:
-            fulltext_wrapper = ArxivAPIWrapper(
-                top_k_results=max_results,
-                load_all_available_meta=True,
-                continue_on_failure=True,
-                doc_content_chars_max=None,
-            )
-            for doc in fulltext_wrapper.load(query):
-                title = doc.metadata.get("Title")
-                if title and doc.page_content:
-                    content_map.setdefault(title, doc.page_content)
-        except Exception:  # pragma: no cover - optional dependency (PyMuPDF)
-            pass
+
+@lru_cache(maxsize=64)
+def _fetch_arxiv_records(
+    query: str, max_results: int, fetch_fulltext: bool, _window: int
+) -> Tuple[Dict[str, Any], ...]:
+    try:
+        search_results = list(_new_wrapper(max_results)._fetch_results(query))  # type: ignore[attr-defined]
+    except Exception as exc:  # pragma: no cover - third-party failure
+        raise _ArxivFetchError(str(exc)) from exc
+    content_map = _load_fulltext(search_results) if fetch_fulltext and search_results else {}
 
     structured_results: List[Dict[str, Any]] = []
     for result in search_results:
@@ -80,4 +127,4 @@ def fetch_arxiv_structured(query: str, max_results: int) -> Tuple[List[Dict[str,
             )
         )
 
-    return structured_results, None
+    return tuple(structured_results)
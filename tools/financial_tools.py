@@ -2,73 +2,136 @@
 from __future__ import annotations
 
 import os
-from datetime import datetime
-from typing import List, Tuple
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
 
 import requests
 
+from utils.fast_json import loads
 from utils.llm_registry import LLMCallMetrics, invoke_llm, zero_metrics
 from utils.structured_data import build_structured_record
 
 FINNHUB_API_KEY = os.getenv("FINNHUB_API_KEY")
 ALPHAVANTAGE_API_KEY = os.getenv("ALPHAVANTAGE_API_KEY")
 
+# Shared keep-alive session for the Finnhub / Alpha Vantage lookups
+_SESSION = requests.Session()
+
 _PROMPT_PATH = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "..", "prompts", "finance_intent_prompt.txt")
 )
 with open(_PROMPT_PATH, "r", encoding="utf-8") as prompt_file:
     FINANCE_INTENT_PROMPT = prompt_file.read()
 
+# Split once around the placeholder so each call is a concatenation, not a format parse
+if "{query}" in FINANCE_INTENT_PROMPT:
+    _PROMPT_PREFIX, _PROMPT_SUFFIX = FINANCE_INTENT_PROMPT.split("{query}", 1)
+else:  # pragma: no cover - template without placeholder
+    _PROMPT_PREFIX, _PROMPT_SUFFIX = None, None
+
+# LLM answers for recent topics (normalized), so repeat topics skip the call entirely
+_INTENT_CACHE_SIZE = 256
+_intent_answers: Dict[str, bool] = {}
+
+FINANCE_KEYWORDS = frozenset({
+    "stock",
+    "finance",
+    "market",
+    "nifty",
+    "sensex",
+    "nasdaq",
+    "dow",
+    "bse",
+    "nse",
+    "share",
+    "equity",
+    "mutual fund",
+    "ipo",
+    "earnings",
+    "dividend",
+    "invest",
+    "portfolio",
+    "bond",
+    "fii",
+    "dii",
+    "fpi",
+    "etf",
+    "s&p",
+    "nyse",
+    "exchange",
+    "commodities",
+    "forex",
+    "currency",
+})
+# Inflected forms that are still unambiguous finance terms. A generic suffix rule
+# would also catch "marketing" or "student exchanges", so those go to the LLM.
+_FINANCE_KEYWORD_FORMS = frozenset({
+    "stocks",
+    "shares",
+    "equities",
+    "bonds",
+    "dividends",
+    "ipos",
+    "mutual funds",
+    "etfs",
+    "investor",
+    "investors",
+    "investing",
+    "investment",
+    "investments",
+    "portfolios",
+})
+# Whole-word keyword match
+_FIN_KEYWORD_RE = re.compile(
+    r"(?<!\w)(?:"
+    + "|".join(map(re.escape, sorted(FINANCE_KEYWORDS | _FINANCE_KEYWORD_FORMS, key=len, reverse=True)))
+    + r")(?!\w)",
+    re.IGNORECASE,
+)
+# A bare ticker such as "NVDA", "$TSLA" or "RELIANCE.NS"
+_TICKER_RE = re.compile(r"^\$?[A-Z]{1,5}(?:\.[A-Z]{1,2})?$")
+
 
 def _format_epoch(value: object) -> str | None:
     """Convert numeric epoch values to ISO 8601 strings when possible."""
     try:
-        return datetime.utcfromtimestamp(float(value)).isoformat() + "Z"
-    except Exception:
+        timestamp = value if isinstance(value, (int, float)) else float(value)
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+    except (TypeError, ValueError, OverflowError, OSError):
         return None
 
 
-def is_financial_intent(topic: str) -> Tuple[bool, LLMCallMetrics]:
-    """Use the finance intent checker to determine if a topic warrants financial lookups."""
-    prompt = FINANCE_INTENT_PROMPT.format(query=topic)
+def is_financial_intent(topic: str, *, force_llm: bool = False) -> Tuple[bool, LLMCallMetrics]:
+    """Determine if a topic warrants financial lookups.
+
+    Obvious cases (a finance keyword or a bare ticker symbol) are answered locally;
+    only ambiguous topics, or any topic when ``force_llm`` is set, go to the
+    finance intent checker LLM.
+    """
+    if not force_llm and (_FIN_KEYWORD_RE.search(topic) or _TICKER_RE.match(topic.strip())):
+        return True, zero_metrics("finance_intent_checker")
+
+    topic_key = " ".join(topic.lower().split())
+    if topic_key in _intent_answers:
+        return _intent_answers[topic_key], zero_metrics("finance_intent_checker")
+
+    if _PROMPT_PREFIX is not None:
+        prompt = _PROMPT_PREFIX + topic + _PROMPT_SUFFIX
+    else:  # pragma: no cover - template without placeholder
+        prompt = FINANCE_INTENT_PROMPT.format(query=topic)
     try:
         response, metrics = invoke_llm("finance_intent_checker", prompt)
         answer = response.content.strip().lower()
-        return answer.startswith("yes"), metrics
+        detected = answer.startswith("yes")
+        if len(_intent_answers) >= _INTENT_CACHE_SIZE:
+            _intent_answers.pop(next(iter(_intent_answers)))
+        _intent_answers[topic_key] = detected
+        return detected, metrics
     except Exception:
         metrics = zero_metrics("finance_intent_checker")
-        finance_keywords: List[str] = [
-            "stock",
-            "finance",
-            "market",
-            "nifty",
-            "sensex",
-            "nasdaq",
-            "dow",
-            "bse",
-            "nse",
-            "share",
-            "equity",
-            "mutual fund",
-            "ipo",
-            "earnings",
-            "dividend",
-            "invest",
-            "portfolio",
-            "bond",
-            "fii",
-            "dii",
-            "fpi",
-            "etf",
-            "s&p",
-            "nyse",
-            "exchange",
-            "commodities",
-            "forex",
-            "currency",
-        ]
-        topic_lower = topic.lower()
-        return any(word in topic_lower for word in finance_keywords), metrics
+        return bool(_FIN_KEYWORD_RE.search(topic)), metrics
 
 
 def get_finnhub_news(symbol: str, from_date: str, to_date: str) -> List[dict]:
@@ -79,9 +142,9 @@ def get_finnhub_news(symbol: str, from_date: str, to_date: str) -> List[dict]:
         "https://finnhub.io/api/v1/company-news"
         f"?symbol={symbol}&from={from_date}&to={to_date}&token={FINNHUB_API_KEY}"
     )
-    resp = requests.get(url, timeout=10)
+    resp = _SESSION.get(url, timeout=10)
     if resp.status_code == 200:
-        return resp.json()
+        return loads(resp.content)
     return []
 
 
@@ -93,9 +156,9 @@ def get_alphavantage_news(symbol: str) -> List[dict]:
         "https://www.alphavantage.co/query"
         f"?function=NEWS_SENTIMENT&tickers={symbol}&apikey={ALPHAVANTAGE_API_KEY}"
     )
-    resp = requests.get(url, timeout=10)
+    resp = _SESSION.get(url, timeout=10)
     if resp.status_code == 200:
-        data = resp.json()
+        data = loads(resp.content)
         return data.get("feed", [])
     return []
 
@@ -107,43 +170,45 @@ def get_financial_news(topic: str, symbol: str | None = None) -> List[dict]:
     today = _dt.date.today()
     week_ago = today - _dt.timedelta(days=7)
     symbol = symbol or topic.upper()
-    finnhub_news = get_finnhub_news(symbol, str(week_ago), str(today))
-    alphav_news = get_alphavantage_news(symbol)
-
-    structured_items = []
-
-    for item in finnhub_news or []:
-        published = item.get("datetime") or item.get("publishedDate")
-        if isinstance(published, (int, float, str)) and str(published).isdigit():
-            published_value = _format_epoch(published)
-        else:
-            published_value = published
-        structured_items.append(
-            build_structured_record(
-                title=item.get("headline"),
-                summary=item.get("summary") or item.get("headline"),
-                content=item.get("summary") or item.get("headline"),
-                source=item.get("url"),
-                published_date=published_value,
-                authors=[item.get("source")] if item.get("source") else None,
-            )
-        )
-
-    for item in alphav_news or []:
-        published = item.get("time_published")
-        summary = item.get("summary") or item.get("title")
-        url = item.get("url")
-        pdf_url = url if url and url.lower().endswith(".pdf") else None
-        structured_items.append(
-            build_structured_record(
-                title=item.get("title"),
-                summary=summary,
-                content=summary,
-                source=url,
-                published_date=published,
-                authors=item.get("authors"),
-                pdf_url=pdf_url,
-            )
-        )
-
-    return structured_items
+    # The two providers are independent hosts, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        finnhub_future = executor.submit(get_finnhub_news, symbol, str(week_ago), str(today))
+        alphav_future = executor.submit(get_alphavantage_news, symbol)
+        finnhub_news = finnhub_future.result()
+        alphav_news = alphav_future.result()
+
+    return [
+        *map(_finnhub_record, finnhub_news or []),
+        *map(_alphavantage_record, alphav_news or []),
+    ]
+
+
+def _finnhub_record(item: dict) -> dict:
+    published = item.get("datetime") or item.get("publishedDate")
+    if isinstance(published, (int, float)) or (isinstance(published, str) and published.isdigit()):
+        published = _format_epoch(published)
+    headline = item.get("headline")
+    summary = item.get("summary") or headline
+    source = item.get("source")
+    return build_structured_record(
+        title=headline,
+        summary=summary,
+        content=summary,
+        source=item.get("url"),
+        published_date=published,
+        authors=[source] if source else None,
+    )
+
+
+def _alphavantage_record(item: dict) -> dict:
+    summary = item.get("summary") or item.get("title")
+    url = item.get("url")
+    return build_structured_record(
+        title=item.get("title"),
+        summary=summary,
+        content=summary,
+        source=url,
+        published_date=item.get("time_published"),
+        authors=item.get("authors"),
+        pdf_url=url if url and url.lower().endswith(".pdf") else None,
+    )
@@ -0,0 +1,57 @@
+"""Concurrent fan-out over the independent research sources (arXiv, Scholar, Perplexity)."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, Iterable, Optional
+
+from tools.academic_tools import fetch_arxiv_structured, scholar_search
+from tools.perplexity_client import PerplexityClient
+from utils.http import close_async_session
+
+__all__ = ["gather_sources", "gather_sources_sync"]
+
+_DEFAULT_SOURCES = ("arxiv", "scholar", "perplexity")
+
+
+async def gather_sources(
+    query: str,
+    *,
+    sources: Iterable[str] = _DEFAULT_SOURCES,
+    max_results: int = 5,
+    scholar_query: Optional[str] = None,
+    perplexity_client: Optional[PerplexityClient] = None,
+    perplexity_system_prompt: str = "",
+    perplexity_kwargs: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Query the requested sources concurrently and return their raw results by name.
+
+    Synchronous tools run in worker threads; Perplexity uses its async client.
+    A source that raises maps to the exception instance instead of failing the
+    whole batch. ``perplexity`` is skipped when no client is supplied.
+    """
+    calls: Dict[str, Any] = {}
+    for name in sources:
+        if name == "arxiv":
+            calls[name] = asyncio.to_thread(fetch_arxiv_structured, query, max_results)
+        elif name == "scholar":
+            calls[name] = asyncio.to_thread(scholar_search.run, scholar_query or query)
+        elif name == "perplexity" and perplexity_client is not None:
+            calls[name] = perplexity_client.deep_search_async(
+                query, perplexity_system_prompt, **(perplexity_kwargs or {})
+            )
+
+    results = await asyncio.gather(*calls.values(), return_exceptions=True)
+    return dict(zip(calls, results))
+
+
+def gather_sources_sync(query: str, **kwargs: Any) -> Dict[str, Any]:
+    """Blocking wrapper around :func:`gather_sources` for synchronous graph nodes."""
+
+    async def _run() -> Dict[str, Any]:
+        try:
+            return await gather_sources(query, **kwargs)
+        finally:
+            # The pooled session belongs to this loop, which asyncio.run closes on return
+            await close_async_session()
+
+    return asyncio.run(_run())
@@ -0,0 +1,196 @@
+"""Response cache for Perplexity deep-search results (exact and semantic lookups)."""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils.caching import ResponseCache
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # pragma: no cover - optional dependency
+    SentenceTransformer = None
+
+_EMBED_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+_DEFAULT_DB_PATH = "data/cache/perplexity_cache.sqlite3"
+_DEFAULT_TTL = 3600
+_DEFAULT_THRESHOLD = 0.92
+# At or below this temperature answers are reproducible, so only exact matches are reused
+_DETERMINISTIC_TEMPERATURE = 0.05
+# Query embeddings kept for semantic lookups; the oldest are dropped beyond this
+_DEFAULT_MAX_ENTRIES = 2048
+# A cache hit costs nothing, so callers that bill usage must not count it again
+_CACHE_HIT_USAGE = {
+    "prompt_tokens": 0,
+    "completion_tokens": 0,
+    "cached_prompt_tokens": 0,
+    "tokens_used": 0,
+    "estimated_cost": 0.0,
+}
+
+
+def _normalize_query(query: str) -> str:
+    return " ".join((query or "").lower().split())
+
+
+class SemanticCache:
+    """Reuse prior deep-search results for identical or near-identical queries.
+
+    Results are stored by an exact SHA256 key in SQLite (with expiry). Query
+    Semantic matching is opt-in (``semantic=True``). It keeps query embeddings
+    in memory (up to ``max_entries``), so a new query can reuse a cached result
+    when its cosine similarity to the cached query reaches ``threshold`` and all
+    other request parameters (model, domain, sampling, token budget, system
+    prompt) are identical. Loading the embedding model takes seconds, so call
+    :meth:`warm_up` at startup rather than paying for it on the first lookup.
+    Without sentence-transformers only exact matches are served.
+    """
+
+    def __init__(
+        self,
+        db_path: str = _DEFAULT_DB_PATH,
+        *,
+        ttl: int = _DEFAULT_TTL,
+        threshold: float = _DEFAULT_THRESHOLD,
+        semantic: bool = False,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self._store = ResponseCache(db_path)
+        self.ttl = ttl
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._semantic = semantic and SentenceTransformer is not None
+        self._embedder: Optional[SentenceTransformer] = None
+        self._vectors: Optional[np.ndarray] = None
+        # (scope, key) per row of _vectors; scope is every request parameter except the query
+        self._entries: List[Tuple[Tuple[Any, ...], str]] = []
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "semantic_hits": 0, "misses": 0}
+
+    @staticmethod
+    def make_key(
+        model: str,
+        domain: str,
+        query: str,
+        temperature: float,
+        top_p: float,
+        max_tokens: int,
+        prompt_hash: str = "",
+    ) -> str:
+        payload = json.dumps(
+            {
+                "model": model,
+                "domain": domain,
+                "query": _normalize_query(query),
+                "temperature": temperature,
+                "top_p": top_p,
+                "max_tokens": max_tokens,
+                "prompt_hash": prompt_hash,
+                # Search options (citations, images) are fixed per model, so the model covers them
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        *,
+        model: str,
+        domain: str,
+        query: str,
+        temperature: float,
+        top_p: float,
+        max_tokens: int,
+        prompt_hash: str = "",
+    ) -> Optional[Dict[str, Any]]:
+        """Return a cached result or None on a miss.
+
+        Hits are marked ``cached=True`` and report zero tokens and cost, since
+        the original call was already billed.
+        """
+        key = self.make_key(model, domain, query, temperature, top_p, max_tokens, prompt_hash)
+        result = self._store.get(key)
+        if result is not None:
+            self.stats["hits"] += 1
+            return {**result, **_CACHE_HIT_USAGE, "cached": True, "query": query}
+
+        if self._semantic and temperature > _DETERMINISTIC_TEMPERATURE:
+            scope = (model, domain, temperature, top_p, max_tokens, prompt_hash)
+            similar_key = self._nearest_key(scope, query)
+            result = self._store.get(similar_key) if similar_key else None
+            if result is not None:
+                self.stats["hits"] += 1
+                self.stats["semantic_hits"] += 1
+                # The payload was generated for the similar query; report the caller's own
+                return {
+                    **result,
+                    **_CACHE_HIT_USAGE,
+                    "cached": True,
+                    "query": query,
+                    "cached_query": result.get("query"),
+                }
+
+        self.stats["misses"] += 1
+        return None
+
+    def set(
+        self,
+        result: Dict[str, Any],
+        *,
+        model: str,
+        domain: str,
+        query: str,
+        temperature: float,
+        top_p: float,
+        max_tokens: int,
+        prompt_hash: str = "",
+    ) -> None:
+        """Store a successful result and index its query embedding."""
+        key = self.make_key(model, domain, query, temperature, top_p, max_tokens, prompt_hash)
+        self._store.set(key, result, ttl=self.ttl)
+        if self._semantic:
+            vector = self._embed(query)
+            with self._lock:
+                if any(entry[1] == key for entry in self._entries):
+                    return
+                rows = vector[np.newaxis, :]
+                self._vectors = rows if self._vectors is None else np.vstack((self._vectors, rows))
+                self._entries.append(((model, domain, temperature, top_p, max_tokens, prompt_hash), key))
+                if len(self._entries) > self.max_entries:
+                    # Oldest rows first; their SQLite entries expire on their own
+                    self._vectors = self._vectors[-self.max_entries:]
+                    self._entries = self._entries[-self.max_entries:]
+
+    def warm_up(self) -> None:
+        """Load the embedding model ahead of the first request (no-op when semantic matching is off)."""
+        if self._semantic:
+            self._embed("warm up")
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self.stats)
+
+    def _embed(self, query: str) -> np.ndarray:
+        if self._embedder is None:
+            self._embedder = SentenceTransformer(_EMBED_MODEL_NAME)
+        vector = self._embedder.encode([_normalize_query(query)], normalize_embeddings=True)[0]
+        return np.asarray(vector, dtype=np.float32)
+
+    def _nearest_key(self, scope: Tuple[Any, ...], query: str) -> Optional[str]:
+        """Key of the most similar cached query stored with exactly the same request parameters."""
+        with self._lock:
+            if self._vectors is None:
+                return None
+            vectors, entries = self._vectors, list(self._entries)
+
+        # Embeddings are normalized, so the dot product is the cosine similarity
+        scores = vectors @ self._embed(query)
+        for idx in np.argsort(scores)[::-1]:
+            if scores[idx] < self.threshold:
+                break
+            if entries[idx][0] == scope:
+                return entries[idx][1]
+        return None
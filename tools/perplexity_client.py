@@ -1,33 +1,153 @@
 """Client utilities for the Perplexity.ai research API."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import re
 import time
-from typing import Any, Dict, Iterable, List, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from tools.perplexity_cache import SemanticCache
+from utils.fast_json import dumps, loads
+from utils.http import get_async_session
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - async path falls back to a worker thread
+    aiohttp = None
 
 _DEFAULT_BASE_URL = "https://api.perplexity.ai"
 _DEFAULT_MODEL = "sonar-pro"
 _DEFAULT_TIMEOUT = 120
-_BULLET_MARKERS = ("-", "*", "\u2022", "\u2023", "\u00b7")
-
-
-def _safe_text(response: requests.Response) -> str:
+_ASYNC_TIMEOUT = aiohttp.ClientTimeout(total=_DEFAULT_TIMEOUT) if aiohttp is not None else None
+
+# Section parsing patterns, compiled once at import
+# Known section titles (lower-case) -> key in the parsed sections dict
+_SECTION_NAMES = {
+    "executive summary": "summary",
+    "summary": "summary",
+    "key findings": "findings",
+    "findings": "findings",
+    "detailed analysis": "analysis",
+    "analysis": "analysis",
+    "discussion": "analysis",
+    "insights & implications": "insights",
+    "insights": "insights",
+    "implications": "insights",
+    "recommended next steps": "next_steps",
+    "next steps": "next_steps",
+    "recommendations": "next_steps",
+}
+_SECTION_NAME_ALT = "|".join(map(re.escape, sorted(_SECTION_NAMES, key=len, reverse=True)))
+_SECTION_NAME_RE = re.compile(rf"(?i)(?:{_SECTION_NAME_ALT})\b")
+# Heading lines: "## 1. Title", "**Title**: text", or a bare known title ("Summary", "Findings: text")
+_ANY_HEADING_RE = re.compile(
+    r"(?im)^[ \t]*(?:"
+    r"(?P<hashes>\#{1,6})[ \t]*(?:\d+[.)][ \t]*)?\**[ \t]*(?P<md_title>[^\n]*?)[ \t*:]*"
+    r"|(?:\d+[.)][ \t]*)?\*\*(?P<bold_title>[^*\n]+?)[ \t:]*\*\*[ \t]*:?[ \t]*(?P<bold_tail>[^\n]*?)"
+    rf"|(?:\d+[.)][ \t]*)?(?P<plain_title>{_SECTION_NAME_ALT})(?:[ \t]*:[ \t]*(?P<plain_tail>[^\n]*?))?"
+    r")[ \t]*$"
+)
+# Bold ("**Title**") and bare titles nest below any "#" heading
+_NON_MARKDOWN_HEADING_LEVEL = 7
+# One bullet or numbered list line; group 1 is the item text without its marker
+_BULLET_LINE_RE = re.compile(r"(?m)^[ \t]*(?:[-*\u2022\u2023\u00b7]|[0-9]+[\).])[ \t]+(.+?)[ \t]*$")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+# Citation fields mapped onto the formatted source; anything else is kept as metadata
+_CITATION_CORE_KEYS = frozenset({"title", "url", "snippet", "excerpt", "link", "type"})
+
+
+def _safe_text(body: bytes) -> str:
     try:
-        return response.text[:500]
+        return body[:500].decode("utf-8", errors="replace")
     except Exception:  # pragma: no cover - defensive
         return ""
 
 
-def _strip_bullet_prefix(value: str) -> str:
-    stripped = value.lstrip("-*\t \u2022\u2023\u00b7")
-    return stripped.lstrip("0123456789. )-\u2022\u2023\u00b7")
+@lru_cache(maxsize=32)
+def _prompt_hash(system_prompt: str) -> str:
+    """Short stable fingerprint used to confirm the static prompt prefix is unchanged."""
+    return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:16]
+
+
+def _system_content(system_prompt: str, system_dynamic: Optional[str]) -> str:
+    # Static instructions first, per-call context last: keeps the prompt prefix cacheable
+    return f"{system_prompt}\n\n{system_dynamic}" if system_dynamic else system_prompt
+
+
+@lru_cache(maxsize=8)
+def _payload_prefix(model: str) -> str:
+    """Serialized request fields that are fixed per model, minus the closing brace."""
+    return dumps({"model": model, "return_citations": True, "return_images": False})[:-1]
+
+
+def _without_raw(result: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in result.items() if key != "raw"}
+
+
+@lru_cache(maxsize=1)
+def _default_cache() -> SemanticCache:
+    """Process-wide cache shared by clients that do not bring their own.
+
+    Exact matches only; pass ``SemanticCache(semantic=True)`` (and call its
+    ``warm_up``) to also reuse answers to near-identical queries.
+    """
+    return SemanticCache()
+
+
+class _StreamAccumulator:
+    """Collect an SSE chat-completion stream into the shape of a non-streamed response.
+
+    Each ``data:`` frame carries a ``delta`` with the next piece of content; the
+    top-level fields of the last frame (citations, usage) are kept as-is.
+    """
+
+    def __init__(self, on_token: Optional[Callable[[str], None]] = None) -> None:
+        self._parts: List[str] = []
+        self._last: Dict[str, Any] = {}
+        self._on_token = on_token
+
+    def feed(self, line: bytes) -> bool:
+        """Consume one line of the stream; returns False once the ``[DONE]`` marker arrives."""
+        line = line.strip()
+        if not line.startswith(b"data:"):
+            return True
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            return False
+        try:
+            event = loads(data)
+        except ValueError:
+            return True
+
+        choices = event.get("choices") or []
+        if choices:
+            token = (choices[0].get("delta") or {}).get("content")
+            if token:
+                self._parts.append(token)
+                if self._on_token:
+                    self._on_token(token)
+        self._last = event
+        return True
+
+    def result(self) -> Dict[str, Any]:
+        if not self._last:
+            return {}
+        return {**self._last, "choices": [{"message": {"content": "".join(self._parts)}}]}
 
 
 class PerplexityClient:
     """Lightweight client wrapping the Perplexity chat completions endpoint."""
 
+    # sonar-pro list price: $1 per million tokens
+    _COST_PER_TOKEN = 1.0 / 1_000_000
+
     SUPPORTED_DOMAINS = {
         "general": "Comprehensive research across all relevant sources.",
         "stocks": "Stock market data, earnings, analyst opinions, and market trends.",
@@ -36,13 +156,42 @@ class PerplexityClient:
         "technology": "Technology developments, product launches, and innovations.",
     }
 
-    def __init__(self, api_key: str, *, model: str = _DEFAULT_MODEL, base_url: str = _DEFAULT_BASE_URL) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        model: str = _DEFAULT_MODEL,
+        base_url: str = _DEFAULT_BASE_URL,
+        cache: Optional[SemanticCache] = None,
+        use_cache: bool = True,
+    ) -> None:
         self._headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         }
         self.base_url = base_url.rstrip("/")
         self.model = model
+        self.cache = (cache or _default_cache()) if use_cache else None
+
+        # Keep-alive session so repeat calls reuse the pooled TLS connection
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+            ),
+        )
+
+    def close(self) -> None:
+        """Release pooled connections held by the client."""
+        self._session.close()
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Hit/miss counters of the response cache (empty when caching is disabled)."""
+        return self.cache.get_stats() if self.cache else {}
 
     def deep_search(
         self,
@@ -53,46 +202,200 @@ class PerplexityClient:
         max_tokens: int = 2000,
         temperature: float = 0.2,
         top_p: float = 0.9,
+        system_dynamic: Optional[str] = None,
+        include_raw: bool = False,
+        stream: bool = False,
+        on_token: Optional[Callable[[str], None]] = None,
     ) -> Dict[str, Any]:
-        """Execute a Perplexity deep-search styled chat completion."""
-        payload = {
-            "model": self.model,
+        """Execute a Perplexity deep-search styled chat completion.
+
+        ``system_prompt`` should hold only instructions that are identical across
+        calls; per-call context (topic, date) goes in ``system_dynamic`` and is
+        appended after it, so the provider can reuse its cached prompt prefix.
+        The full API response is attached as ``raw`` only when ``include_raw`` is set.
+        With ``stream`` the completion is read as server-sent events and each
+        content delta is passed to ``on_token`` as it arrives; sections are still
+        extracted once the stream completes.
+        """
+        cache_fields = dict(
+            model=self.model, domain=domain, query=query,
+            temperature=temperature, top_p=top_p, max_tokens=max_tokens,
+            prompt_hash=_prompt_hash(_system_content(system_prompt, system_dynamic)),
+        )
+        if self.cache and not include_raw:
+            cached = self.cache.get(**cache_fields)
+            if cached is not None:
+                if on_token:
+                    on_token(cached.get("content", ""))
+                return cached
+
+        payload = self._build_payload(
+            query, system_prompt, system_dynamic, max_tokens, temperature, top_p, stream=stream
+        )
+
+        url = f"{self.base_url}/chat/completions"
+        start = time.perf_counter()
+        try:
+            with self._session.post(
+                url, data=payload, timeout=_DEFAULT_TIMEOUT, stream=stream
+            ) as response:
+                if stream and response.status_code < 400:
+                    accumulator = _StreamAccumulator(on_token)
+                    for line in response.iter_lines():
+                        if not accumulator.feed(line):
+                            break
+                    parsed = self._finish_result(
+                        accumulator.result(), time.perf_counter() - start,
+                        query=query, domain=domain, include_raw=include_raw,
+                    )
+                else:
+                    parsed = self._finish_response(
+                        response.status_code, response.content, time.perf_counter() - start,
+                        query=query, domain=domain, include_raw=include_raw,
+                    )
+        except requests.RequestException as exc:
+            return self._connection_error(exc, time.perf_counter() - start)
+
+        if parsed.get("success"):
+            parsed["system_prompt_hash"] = _prompt_hash(system_prompt)
+            if self.cache:
+                self.cache.set(_without_raw(parsed), **cache_fields)
+        return parsed
+
+    async def deep_search_async(
+        self,
+        query: str,
+        system_prompt: str,
+        *,
+        domain: str = "general",
+        max_tokens: int = 2000,
+        temperature: float = 0.2,
+        top_p: float = 0.9,
+        system_dynamic: Optional[str] = None,
+        include_raw: bool = False,
+        stream: bool = False,
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`deep_search` sharing one aiohttp session per event loop."""
+        if aiohttp is None:
+            return await asyncio.to_thread(
+                self.deep_search,
+                query,
+                system_prompt,
+                domain=domain,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+                system_dynamic=system_dynamic,
+                include_raw=include_raw,
+                stream=stream,
+                on_token=on_token,
+            )
+
+        cache_fields = dict(
+            model=self.model, domain=domain, query=query,
+            temperature=temperature, top_p=top_p, max_tokens=max_tokens,
+            prompt_hash=_prompt_hash(_system_content(system_prompt, system_dynamic)),
+        )
+        if self.cache and not include_raw:
+            cached = await asyncio.to_thread(self.cache.get, **cache_fields)
+            if cached is not None:
+                if on_token:
+                    on_token(cached.get("content", ""))
+                return cached
+
+        payload = self._build_payload(
+            query, system_prompt, system_dynamic, max_tokens, temperature, top_p, stream=stream
+        )
+
+        url = f"{self.base_url}/chat/completions"
+        start = time.perf_counter()
+        try:
+            session = get_async_session()
+            async with session.post(
+                url, headers=self._headers, data=payload, timeout=_ASYNC_TIMEOUT
+            ) as response:
+                if stream and response.status < 400:
+                    accumulator = _StreamAccumulator(on_token)
+                    async for line in response.content:
+                        if not accumulator.feed(line):
+                            break
+                    parsed = self._finish_result(
+                        accumulator.result(), time.perf_counter() - start,
+                        query=query, domain=domain, include_raw=include_raw,
+                    )
+                else:
+                    body = await response.read()
+                    parsed = self._finish_response(
+                        response.status, body, time.perf_counter() - start,
+                        query=query, domain=domain, include_raw=include_raw,
+                    )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            return self._connection_error(exc, time.perf_counter() - start)
+
+        if parsed.get("success"):
+            parsed["system_prompt_hash"] = _prompt_hash(system_prompt)
+            if self.cache:
+                await asyncio.to_thread(self.cache.set, _without_raw(parsed), **cache_fields)
+        return parsed
+
+    def _build_payload(
+        self,
+        query: str,
+        system_prompt: str,
+        system_dynamic: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        top_p: float,
+        *,
+        stream: bool = False,
+    ) -> bytes:
+        """Serialize the request body, splicing per-call fields onto the cached static prefix."""
+        system_content = _system_content(system_prompt, system_dynamic)
+        dynamic = {
             "messages": [
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": system_content},
                 {"role": "user", "content": query},
             ],
             "max_tokens": max_tokens,
             "temperature": temperature,
             "top_p": top_p,
-            "return_citations": True,
-            "return_images": False,
         }
+        if stream:
+            dynamic["stream"] = True
+        return ",".join((_payload_prefix(self.model), dumps(dynamic)[1:])).encode("utf-8")
 
-        url = f"{self.base_url}/chat/completions"
-        start = time.perf_counter()
-        try:
-            response = requests.post(url, headers=self._headers, json=payload, timeout=_DEFAULT_TIMEOUT)
-        except requests.RequestException as exc:
-            duration = time.perf_counter() - start
-            return {
-                "success": False,
-                "error": f"Connection error: {exc}",
-                "tokens_used": 0,
-                "duration": duration,
-            }
+    @staticmethod
+    def _connection_error(exc: Exception, duration: float) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": f"Connection error: {exc}",
+            "tokens_used": 0,
+            "duration": duration,
+        }
 
-        duration = time.perf_counter() - start
-        if not response.ok:
+    def _finish_response(
+        self,
+        status_code: int,
+        body: bytes,
+        duration: float,
+        *,
+        query: str,
+        domain: str,
+        include_raw: bool = False,
+    ) -> Dict[str, Any]:
+        """Turn a raw HTTP status/body pair into the client's result dict."""
+        if status_code >= 400:
             return {
                 "success": False,
-                "error": f"API error {response.status_code}: {_safe_text(response)}",
+                "error": f"API error {status_code}: {_safe_text(body)}",
                 "tokens_used": 0,
-                "status_code": response.status_code,
+                "status_code": status_code,
                 "duration": duration,
             }
 
         try:
-            result = response.json()
+            result = loads(body)
         except ValueError:
             return {
                 "success": False,
@@ -101,7 +404,21 @@ class PerplexityClient:
                 "duration": duration,
             }
 
+        return self._finish_result(result, duration, query=query, domain=domain, include_raw=include_raw)
+
+    def _finish_result(
+        self,
+        result: Dict[str, Any],
+        duration: float,
+        *,
+        query: str,
+        domain: str,
+        include_raw: bool = False,
+    ) -> Dict[str, Any]:
+        """Parse a decoded (or stream-assembled) API response and attach timing."""
         parsed = self._parse_response(result, query=query, domain=domain)
+        if include_raw and parsed.get("success"):
+            parsed["raw"] = result
         parsed.setdefault("tokens_used", 0)
         parsed["duration"] = duration
         return parsed
@@ -123,6 +440,7 @@ class PerplexityClient:
         prompt_tokens = int(usage.get("prompt_tokens") or 0)
         completion_tokens = int(usage.get("completion_tokens") or usage.get("generation_tokens") or 0)
         total_tokens = int(usage.get("total_tokens") or (prompt_tokens + completion_tokens))
+        cached_prompt_tokens = int((usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0)
 
         sections = self._extract_sections(content)
 
@@ -136,10 +454,10 @@ class PerplexityClient:
             "citation_count": len(citations),
             "prompt_tokens": prompt_tokens,
             "completion_tokens": completion_tokens,
+            "cached_prompt_tokens": cached_prompt_tokens,
             "tokens_used": total_tokens,
             "estimated_cost": self._estimate_cost(prompt_tokens, completion_tokens),
             "model": self.model,
-            "raw": result,
         }
 
     @staticmethod
@@ -174,110 +492,98 @@ class PerplexityClient:
         if not text.strip():
             return sections
 
-        summary_block = self._locate_section(text, ("Executive Summary", "Summary"))
-        if summary_block:
-            sections["summary"] = self._truncate_sentences(summary_block, 3)
-
-        findings_block = self._locate_section(text, ("Key Findings", "Findings"))
-        if findings_block:
-            sections["findings"] = self._collect_bullets(findings_block)
-
-        analysis_block = self._locate_section(text, ("Detailed Analysis", "Analysis", "Discussion"))
-        if analysis_block:
-            sections["analysis"] = analysis_block.strip()
-
-        insights_block = self._locate_section(text, ("Insights & Implications", "Insights", "Implications"))
-        if insights_block:
-            sections["insights"] = self._collect_bullets(insights_block)
-
-        next_steps_block = self._locate_section(text, ("Recommended Next Steps", "Next Steps"))
-        if next_steps_block:
-            sections["next_steps"] = self._collect_bullets(next_steps_block)
+        # First non-empty body per section, in document order
+        blocks: Dict[str, str] = {}
+        for name, body in self._split_sections(text):
+            if name and name not in blocks:
+                body = body.strip()
+                if body:
+                    blocks[name] = body
+
+        if "summary" in blocks:
+            sections["summary"] = self._truncate_sentences(blocks["summary"], 3)
+        if "analysis" in blocks:
+            sections["analysis"] = blocks["analysis"]
+        for name in ("findings", "insights", "next_steps"):
+            if name in blocks:
+                sections[name] = self._collect_bullets(blocks[name])
 
         if not sections["findings"]:
             sections["findings"] = self._collect_bullets(self._fallback_first_bullets(text))
 
         return sections
 
-    def _locate_section(self, text: str, headers: Iterable[str]) -> Optional[str]:
-        for header in headers:
-            heading = re.compile(
-                rf"(?im)^\s*(?:\d+\.\s*)?(?:[#*]+\s*)?\**{re.escape(header)}\**\s*:?.*$"
-            )
-            match = heading.search(text)
-            if not match:
+    @staticmethod
+    def _split_sections(text: str) -> List[Tuple[Optional[str], str]]:
+        """Split text into (section name, body) spans with one scan for headings.
+
+        A known section title always starts a new section. Other headings only
+        end the current section when they are at the same or a higher level
+        (``#`` count; bold and bare titles rank below every markdown level), so
+        a ``### Market context`` sub-heading stays inside ``## Key Findings``.
+        Such a heading then starts a ``None`` section. A bold lead-in such as
+        ``**Revenue**: up 10%`` is always body text.
+        """
+        spans: List[Tuple[Optional[str], str]] = []
+        current: Optional[str] = None
+        current_level = 0
+        body_start = 0
+        tail = ""
+        for match in _ANY_HEADING_RE.finditer(text):
+            title = match.group("md_title") or match.group("bold_title") or match.group("plain_title") or ""
+            name_match = _SECTION_NAME_RE.match(title.strip())
+            name = _SECTION_NAMES[name_match.group(0).lower()] if name_match else None
+            next_tail = match.group("bold_tail") or match.group("plain_tail") or ""
+            hashes = match.group("hashes")
+            level = len(hashes) if hashes else _NON_MARKDOWN_HEADING_LEVEL
+            if name is None and (next_tail or current is None or level > current_level):
                 continue
-            start = match.end()
-            remainder = text[start:]
-            boundary = re.compile(r"(?im)^\s*(?:\d+\.\s*)?(?:[#*]+\s*)?\**[A-Z][^\n]{0,80}\**\s*:?.*$")
-            next_match = boundary.search(remainder)
-            end = next_match.start() if next_match else len(remainder)
-            section_text = remainder[:end].strip()
-            if section_text:
-                return section_text
-        return None
+            spans.append((current, f"{tail}\n{text[body_start:match.start()]}"))
+            current, current_level, tail, body_start = name, level, next_tail, match.end()
+        spans.append((current, f"{tail}\n{text[body_start:]}"))
+        return spans
 
     def _collect_bullets(self, section_text: str) -> List[str]:
-        bullets: List[str] = []
-        for line in (section_text or "").splitlines():
-            stripped = line.strip()
-            if not stripped:
-                continue
-            if stripped.startswith(_BULLET_MARKERS) or re.match(r"^[0-9]+[\).]", stripped):
-                cleaned = _strip_bullet_prefix(stripped)
-                if cleaned:
-                    bullets.append(cleaned)
-        return bullets
+        return [match.group(1) for match in _BULLET_LINE_RE.finditer(section_text or "")]
 
     @staticmethod
     def _fallback_first_bullets(text: str) -> str:
-        lines: List[str] = []
-        for line in text.splitlines():
-            if len(lines) >= 6:
-                break
-            stripped = line.strip()
-            if stripped.startswith(_BULLET_MARKERS) or re.match(r"^[0-9]+[\).]", stripped):
-                lines.append(stripped)
-        return "\n".join(lines)
+        return "\n".join(match.group(0) for match in islice(_BULLET_LINE_RE.finditer(text), 6))
 
     @staticmethod
     def _truncate_sentences(text: str, max_sentences: int) -> str:
-        sentences = re.split(r"(?<=[.!?])\s+", text.strip())
+        sentences = _SENTENCE_SPLIT_RE.split(text.strip())
         return " ".join(sentences[:max_sentences]).strip()
 
     def _format_citations(self, citations: Any) -> List[Dict[str, Any]]:
-        formatted: List[Dict[str, Any]] = []
         if not citations:
-            return formatted
-        for idx, citation in enumerate(citations, start=1):
-            if isinstance(citation, str):
-                formatted.append(
-                    {
-                        "id": idx,
-                        "title": f"Source {idx}",
-                        "url": citation,
-                        "snippet": None,
-                        "type": "web",
-                    }
-                )
-            elif isinstance(citation, dict):
-                formatted.append(
-                    {
-                        "id": idx,
-                        "title": citation.get("title") or citation.get("source") or f"Source {idx}",
-                        "url": citation.get("url") or citation.get("link"),
-                        "snippet": citation.get("snippet") or citation.get("excerpt"),
-                        "type": citation.get("type") or "web",
-                        "metadata": {
-                            k: v
-                            for k, v in citation.items()
-                            if k not in {"title", "url", "snippet", "excerpt", "link", "type"}
-                        },
-                    }
-                )
-        return formatted
+            return []
+        build = self._build_citation
+        return [
+            build(idx, citation)
+            for idx, citation in enumerate(citations, start=1)
+            if isinstance(citation, (str, dict))
+        ]
 
     @staticmethod
-    def _estimate_cost(prompt_tokens: int, completion_tokens: int) -> float:
-        total = prompt_tokens + completion_tokens
-        return (total / 1_000_000) * 1.0
+    def _build_citation(idx: int, citation: Any) -> Dict[str, Any]:
+        if isinstance(citation, str):
+            return {
+                "id": idx,
+                "title": f"Source {idx}",
+                "url": citation,
+                "snippet": None,
+                "type": "web",
+            }
+        return {
+            "id": idx,
+            "title": citation.get("title") or citation.get("source") or f"Source {idx}",
+            "url": citation.get("url") or citation.get("link"),
+            "snippet": citation.get("snippet") or citation.get("excerpt"),
+            "type": citation.get("type") or "web",
+            "metadata": {k: v for k, v in citation.items() if k not in _CITATION_CORE_KEYS},
+        }
+
+    @classmethod
+    def _estimate_cost(cls, prompt_tokens: int, completion_tokens: int) -> float:
+        return (prompt_tokens + completion_tokens) * cls._COST_PER_TOKEN
@@ -1,61 +1,329 @@
 """Social media scraping helpers for sentiment analysis."""
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
-from typing import List
+import random
+import threading
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from utils.structured_data import build_structured_record
+from utils.fast_json import loads
+from utils.http import close_async_session, get_async_session
+from utils.structured_data import build_structured_records_bulk
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - async path falls back to a worker thread
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
 
 TWITTER_BEARER_TOKEN = os.getenv("TWITTER_BEARER_TOKEN")
 
+_SEARCH_URL = "https://api.twitter.com/2/tweets/search/recent"
+_TIMEOUT = 10
+_ASYNC_TIMEOUT = aiohttp.ClientTimeout(total=_TIMEOUT) if aiohttp is not None else None
+
+# Keep-alive session so repeat searches reuse the TLS connection to api.twitter.com
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+# Auth header is built once: set on the requests session, passed to the shared aiohttp one
+_AUTH_HEADER = {"Authorization": f"Bearer {TWITTER_BEARER_TOKEN}"} if TWITTER_BEARER_TOKEN else {}
+_SESSION.headers.update(_AUTH_HEADER)
+
+# Fields requested on every search; values are str so aiohttp accepts them as-is
+_BASE_PARAMS = MappingProxyType({
+    "tweet.fields": "created_at,author_id,text",
+    "expansions": "author_id",
+    "user.fields": "name,username",
+})
+
+# Identical searches are answered from memory within this window (seconds), sparing the rate limit
+_SEARCH_CACHE_TTL = 300
+
+# Recent search allows 450 requests per 15 minutes with app auth
+_RATE_LIMIT_PER_SECOND = 450 / 900
+_RATE_LIMIT_BURST = 10
+# Longer waits than this (seconds) give up on the search instead of stalling the agent
+_MAX_RATE_LIMIT_WAIT = 60
+
+
+class _TokenBucket:
+    """Thread-safe token bucket; ``reserve`` takes a token and returns the wait before using it.
+
+    When the wait would exceed ``max_wait`` no token is taken and None is returned,
+    so refused calls don't push the bucket further into debt.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: float = float("inf")) -> Optional[float]:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            if wait > max_wait:
+                return None
+            self._tokens -= 1
+            return wait
+
+
+_BUCKET = _TokenBucket(_RATE_LIMIT_PER_SECOND, _RATE_LIMIT_BURST)
+
+
+class _CircuitBreaker:
+    """Opens after ``fail_max`` consecutive failed searches and rejects calls for ``reset_timeout`` seconds.
+
+    Once the timeout passes the circuit is half-open: a single trial call goes
+    through while the others keep being rejected. A failed trial re-opens the
+    circuit straight away, a successful one closes it. A trial that never
+    reports back (e.g. refused by the rate limiter) lets another through after
+    a further ``reset_timeout``.
+    """
+
+    def __init__(self, fail_max: int, reset_timeout: float) -> None:
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._half_open = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at < self.reset_timeout:
+                return False
+            # Admit this caller as the trial; restarting the clock keeps everyone else out
+            self._half_open = True
+            self._opened_at = now
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._half_open = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._half_open or self._failures >= self.fail_max:
+                if self._opened_at is None:
+                    logger.warning("Twitter search failing; skipping calls for %ss", self.reset_timeout)
+                self._opened_at = time.monotonic()
+                self._half_open = False
+
+
+# During an API outage searches return nothing at once instead of each waiting out timeouts.
+# Failures are counted per search (after its retries), not per attempt.
+_BREAKER = _CircuitBreaker(fail_max=3, reset_timeout=30)
+# Attempts per search; 429s and 5xx responses are retried
+_MAX_ATTEMPTS = 3
+# Epoch time until which the server said the budget is exhausted
+_reset_at = 0.0
+
+
+def _search_params(query: str, max_results: int, since_id: Optional[str] = None) -> dict:
+    params = {"query": query, "max_results": str(max_results), **_BASE_PARAMS}
+    if since_id:
+        # Server-side filter: only tweets newer than the last one already collected
+        params["since_id"] = str(since_id)
+    return params
+
+
+class _TwitterFetchError(Exception):
+    """Raised inside the cached search so failed responses are not memoized."""
+
+
+def _budget_delay() -> float:
+    """Seconds to wait before the next request, per the local bucket and the server's reset time."""
+    server_delay = _reset_at - time.time()
+    if server_delay > _MAX_RATE_LIMIT_WAIT:
+        raise _TwitterFetchError(f"rate limited for {server_delay:.0f}s")
+    # Checked before a token is taken, so a refused search costs nothing from the budget
+    local_delay = _BUCKET.reserve(_MAX_RATE_LIMIT_WAIT)
+    if local_delay is None:
+        raise _TwitterFetchError("local rate limit budget exhausted")
+    return max(local_delay, server_delay)
+
+
+def _note_rate_limit(status_code: int, headers: Any) -> None:
+    """Track the server-side budget from the x-rate-limit-* response headers."""
+    global _reset_at
+    remaining = headers.get("x-rate-limit-remaining")
+    reset = headers.get("x-rate-limit-reset")
+    if remaining is not None:
+        logger.debug("Twitter search budget remaining: %s", remaining)
+    if reset and (status_code == 429 or remaining == "0"):
+        try:
+            _reset_at = float(reset)
+        except ValueError:
+            pass
 
-def twitter_search(query: str, max_results: int = 10) -> List[dict]:
-    """Return recent tweets for a query as structured research records."""
+
+def _retry_delay(status_code: int, attempt: int) -> Optional[float]:
+    """Seconds to back off before retrying a response, or None if it should not be retried."""
+    if attempt + 1 >= _MAX_ATTEMPTS:
+        return None
+    if status_code == 429:
+        # _budget_delay already waits for the reset time the server sent
+        return 0.0
+    if status_code >= 500:
+        # Jittered exponential backoff so concurrent searches don't retry in lockstep
+        return min(2 ** attempt + random.random(), 8)
+    return None
+
+
+def _record_outcome(status_code: int) -> None:
+    # Called once per search with its final status. Only server errors count
+    # towards opening the circuit; 4xx are the request's fault
+    if status_code >= 500:
+        _BREAKER.record_failure()
+    else:
+        _BREAKER.record_success()
+
+
+def twitter_search(query: str, max_results: int = 10, *, since_id: Optional[str] = None) -> List[dict]:
+    """Return recent tweets for a query as structured research records.
+
+    Pass the newest tweet id from a previous call as ``since_id`` to fetch only
+    tweets posted after it.
+    """
     if not TWITTER_BEARER_TOKEN:
         return []
-    url = "https://api.twitter.com/2/tweets/search/recent"
-    headers = {"Authorization": f"Bearer {TWITTER_BEARER_TOKEN}"}
-    params = {
-        "query": query,
-        "max_results": max_results,
-        "tweet.fields": "created_at,author_id,text",
-        "expansions": "author_id",
-        "user.fields": "name,username",
-    }
-    resp = requests.get(url, headers=headers, params=params, timeout=10)
+    try:
+        records = _cached_twitter_search(
+            " ".join(query.split()), max_results, since_id, int(time.time() // _SEARCH_CACHE_TTL)
+        )
+    except _TwitterFetchError:
+        return []
+    # Copy so callers can't mutate the cached records
+    return [dict(record) for record in records]
+
+
+@lru_cache(maxsize=256)
+def _cached_twitter_search(
+    query: str, max_results: int, since_id: Optional[str], _window: int
+) -> Tuple[dict, ...]:
+    if not _BREAKER.allow():
+        raise _TwitterFetchError("circuit open")
+    params = _search_params(query, max_results, since_id)
+    for attempt in range(_MAX_ATTEMPTS):
+        time.sleep(_budget_delay())
+        try:
+            resp = _SESSION.get(_SEARCH_URL, params=params, timeout=_TIMEOUT)
+        except requests.RequestException as exc:
+            _BREAKER.record_failure()
+            raise _TwitterFetchError(str(exc)) from exc
+        _note_rate_limit(resp.status_code, resp.headers)
+        delay = _retry_delay(resp.status_code, attempt)
+        if delay is None:
+            break
+        time.sleep(delay)
+    _record_outcome(resp.status_code)
     if resp.status_code != 200:
+        raise _TwitterFetchError(resp.status_code)
+    return tuple(_structure_tweets(loads(resp.content)))
+
+
+async def twitter_search_async(
+    query: str, max_results: int = 10, *, since_id: Optional[str] = None
+) -> List[dict]:
+    """Async variant of :func:`twitter_search` using a pooled aiohttp session."""
+    if not TWITTER_BEARER_TOKEN:
         return []
+    if aiohttp is None:
+        return await asyncio.to_thread(twitter_search, query, max_results, since_id=since_id)
 
-    data = resp.json()
-    tweets = data.get("data", [])
-    users = {user["id"]: user for user in data.get("includes", {}).get("users", [])}
-
-    structured = []
-    for tweet in tweets:
-        author_id = tweet.get("author_id")
-        user = users.get(author_id)
-        if user:
-            authors = [user.get("name") or user.get("username") or author_id]
-            username = user.get("username")
-        else:
-            authors = [author_id] if author_id else []
-            username = None
-        tweet_url = (
-            f"https://twitter.com/{username}/status/{tweet['id']}"
-            if username
-            else f"https://twitter.com/i/web/status/{tweet['id']}"
-        )
-        text = tweet.get("text", "")
-        structured.append(
-            build_structured_record(
-                title=text[:120] if text else None,
-                summary=text,
-                content=text,
-                source=tweet_url,
-                published_date=tweet.get("created_at"),
-                authors=authors,
-            )
-        )
-    return structured
+    params = _search_params(query, max_results, since_id)
+    if not _BREAKER.allow():
+        return []
+    try:
+        for attempt in range(_MAX_ATTEMPTS):
+            await asyncio.sleep(_budget_delay())
+            async with get_async_session().get(
+                _SEARCH_URL, params=params, headers=_AUTH_HEADER, timeout=_ASYNC_TIMEOUT
+            ) as resp:
+                _note_rate_limit(resp.status, resp.headers)
+                body = await resp.read() if resp.status == 200 else None
+            delay = _retry_delay(resp.status, attempt)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        _BREAKER.record_failure()
+        return []
+    except _TwitterFetchError:
+        return []
+    _record_outcome(resp.status)
+    return _structure_tweets(loads(body)) if body is not None else []
+
+
+def twitter_search_many(queries: List[str], max_results: int = 10) -> List[List[dict]]:
+    """Run several searches concurrently over the shared async session.
+
+    Returns one record list per query, in input order; repeated queries are
+    requested once. Each list is that query's own result set (deduplicated
+    within its page only), independent of the other queries.
+    """
+    unique = list(dict.fromkeys(" ".join(query.split()) for query in queries))
+
+    async def _gather() -> List[List[dict]]:
+        try:
+            return await asyncio.gather(*(twitter_search_async(query, max_results) for query in unique))
+        finally:
+            # The pooled session belongs to this loop, which asyncio.run closes on return
+            await close_async_session()
+
+    by_query = dict(zip(unique, asyncio.run(_gather()))) if unique else {}
+    return [[dict(record) for record in by_query[" ".join(query.split())]] for query in queries]
+
+
+def _structure_tweets(data: dict) -> List[dict]:
+    # author id -> (display name, username), resolved once for the whole page
+    user_display = {
+        user["id"]: (user.get("name") or user.get("username") or user["id"], user.get("username"))
+        for user in data.get("includes", {}).get("users", [])
+    }
+    # The API can repeat a tweet within a page for trending queries; keep the first copy
+    tweets = {}
+    for tweet in data.get("data", []):
+        tweets.setdefault(tweet["id"], tweet)
+    return build_structured_records_bulk(_tweet_row(tweet, user_display) for tweet in tweets.values())
+
+
+def _tweet_row(tweet: dict, user_display: dict) -> tuple:
+    """Record fields for one tweet, in build_structured_records_bulk row order."""
+    author_id = tweet.get("author_id")
+    display, username = user_display.get(author_id) or (author_id, None)
+    tweet_url = (
+        f"https://twitter.com/{username}/status/{tweet['id']}"
+        if username
+        else f"https://twitter.com/i/web/status/{tweet['id']}"
+    )
+    text = tweet.get("text", "")
+    return (
+        text[:120] if text else None,
+        text,
+        text,
+        tweet_url,
+        tweet.get("created_at"),
+        [display] if display else [],
+        None,
+    )
@@ -2,6 +2,10 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 from dotenv import load_dotenv
 from langchain_community.tools import DuckDuckGoSearchRun
@@ -19,30 +23,68 @@ except ImportError:  # pragma: no cover - optional dependency
     TAVILY_AVAILABLE = False
 
 # Load API keys from the project-level .env so downstream imports can access them.
+# Keys already set in the environment win.
 dotenv_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env')
-load_dotenv(dotenv_path)
+load_dotenv(dotenv_path, override=False)
 
-# DuckDuckGo is always available and used both as a standalone tool and a fallback for other providers.
-duckduckgo_search = DuckDuckGoSearchRun(
-    name="DuckDuckGoWebSearch",
-    description="Performs a web search using DuckDuckGo.",
-)
 
-searchapi_key = os.getenv("SEARCHAPI_API_KEY")
-if SERPAPI_AVAILABLE and searchapi_key:
+# Tools are built on first use rather than at import, so reloads don't pay for unused providers.
+@lru_cache(maxsize=1)
+def get_duckduckgo() -> DuckDuckGoSearchRun:
+    """DuckDuckGo is always available and used both as a standalone tool and a fallback for other providers."""
+    return DuckDuckGoSearchRun(
+        name="DuckDuckGoWebSearch",
+        description="Performs a web search using DuckDuckGo.",
+    )
+
+
+@lru_cache(maxsize=1)
+def get_serpapi() -> Optional[Any]:
+    """SearchAPI tool, or None when the SDK or API key is missing."""
+    searchapi_key = os.getenv("SEARCHAPI_API_KEY")
+    if not (SERPAPI_AVAILABLE and searchapi_key):
+        return None
     try:
-        serpapi_search = SearchAPIRun(api_wrapper_kwargs={"searchapi_api_key": searchapi_key})
+        return SearchAPIRun(api_wrapper_kwargs={"searchapi_api_key": searchapi_key})
     except Exception:  # pragma: no cover - network failure
-        serpapi_search = None
-else:
-    serpapi_search = None
+        return None
+
 
-# Tavily provides richer results when the SDK and API key are present.
-tavily_key = os.getenv("TAVILY_API_KEY")
-if TAVILY_AVAILABLE and tavily_key:
+@lru_cache(maxsize=1)
+def get_tavily() -> Optional[Any]:
+    """Tavily provides richer results when the SDK and API key are present."""
+    tavily_key = os.getenv("TAVILY_API_KEY")
+    if not (TAVILY_AVAILABLE and tavily_key):
+        return None
     try:
-        tavily_search = TavilySearchResults(api_key=tavily_key)
+        return TavilySearchResults(api_key=tavily_key)
     except Exception:  # pragma: no cover - network failure
-        tavily_search = None
-else:
-    tavily_search = None
+        return None
+
+
+# Recent results per (tool name, normalized query), so repeat searches in a session skip the network
+_SEARCH_CACHE_TTL = 300
+_SEARCH_CACHE_SIZE = 256
+_search_results: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+_search_lock = threading.Lock()
+
+
+def cached_search(tool: Any, query: str) -> Any:
+    """Run ``tool.run(query)``, reusing a result from the last few minutes for the same query.
+
+    Failures are not cached, so the next call retries the provider.
+    """
+    key = (tool.name, " ".join(query.split()))
+    now = time.monotonic()
+    with _search_lock:
+        entry = _search_results.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    result = tool.run(query)
+    with _search_lock:
+        _search_results.pop(key, None)
+        if len(_search_results) >= _SEARCH_CACHE_SIZE:
+            _search_results.pop(next(iter(_search_results)))
+        _search_results[key] = (now + _SEARCH_CACHE_TTL, result)
+    return result
@@ -4,53 +4,69 @@
 import streamlit as st
 from config.constants import DOMAIN_AGENT_MAP
 
+AGENT_INFO = {
+    "perplexity": {
+        "name": "Web Research",
+        "icon": "🌐",
+        "description": "Deep web analysis using Perplexity AI",
+    },
+    "youtube": {
+        "name": "Video Analysis",
+        "icon": "📹",
+        "description": "YouTube sentiment analysis (Coming Soon)",
+    },
+    "api": {
+        "name": "API Agent",
+        "icon": "📚",
+        "description": "Academic papers and news (Coming Soon)",
+    }
+}
+
+RECOMMENDATION_TEXT = {
+    "stocks": "Web Research for real-time data, API Agent for news.",
+    "medical": "Web Research for latest studies and research.",
+    "academic": "Web Research for papers, API Agent for citations.",
+    "technology": "Web Research for latest tech news and trends."
+}
+
+# Multiselect labels, built once instead of on every rerun
+AGENT_LABELS = {agent_id: f"{info['icon']} {info['name']}" for agent_id, info in AGENT_INFO.items()}
+AGENT_OPTIONS = list(AGENT_LABELS.values())
+
+# domain -> (recommended agents, recommendation text, default multiselect labels), resolved once
+def _domain_profile(recommended: list, text: str) -> tuple:
+    return recommended, text, [AGENT_LABELS[agent_id] for agent_id in recommended]
+
+_DEFAULT_PROFILE = _domain_profile(["perplexity", "api"], "Web Research + API Agent")
+_DOMAIN_PROFILES = {
+    domain: _domain_profile(
+        DOMAIN_AGENT_MAP.get(domain, _DEFAULT_PROFILE[0]),
+        RECOMMENDATION_TEXT.get(domain, _DEFAULT_PROFILE[1]),
+    )
+    for domain in DOMAIN_AGENT_MAP.keys() | RECOMMENDATION_TEXT.keys()
+}
+
 def render_agent_display(domain: str, processing: bool = False) -> list:
     """Render agent selection and status in a unified display."""
     
     st.markdown("### Select Research Sources")
 
-    agent_info = {
-        "perplexity": {
-            "name": "Web Research",
-            "icon": "🌐",
-            "description": "Deep web analysis using Perplexity AI",
-        },
-        "youtube": {
-            "name": "Video Analysis",
-            "icon": "📹",
-            "description": "YouTube sentiment analysis (Coming Soon)",
-        },
-        "api": {
-            "name": "API Agent",
-            "icon": "📚",
-            "description": "Academic papers and news (Coming Soon)",
-        }
-    }
-
-    recommended = DOMAIN_AGENT_MAP.get(domain, ["perplexity", "api"])
+    agent_info = AGENT_INFO
+    _, recommendation, default_selection = _DOMAIN_PROFILES.get(domain, _DEFAULT_PROFILE)
     
-    recommendation_text = {
-        "stocks": "Web Research for real-time data, API Agent for news.",
-        "medical": "Web Research for latest studies and research.",
-        "academic": "Web Research for papers, API Agent for citations.",
-        "technology": "Web Research for latest tech news and trends."
-    }
-    st.info(f"**Recommended for {domain.capitalize()}:** {recommendation_text.get(domain, 'Web Research + API Agent')}")
+    st.info(f"**Recommended for {domain.capitalize()}:** {recommendation}")
 
     # Agent selection
-    options = [f"{info['icon']} {info['name']}" for agent_id, info in agent_info.items()]
-    default_selection = [f"{agent_info[agent_id]['icon']} {agent_info[agent_id]['name']}" for agent_id in recommended]
-
     selected_options = st.multiselect(
         "Select sources:",
-        options=options,
-        default=default_selection,
+        options=AGENT_OPTIONS,
+        default=list(default_selection),
         help="Choose the sources you want to use for your research."
     )
 
     # Map back to agent IDs
-    selected_agents = [agent_id for agent_id, info in agent_info.items() 
-                      if f"{info['icon']} {info['name']}" in selected_options]
+    selected = set(selected_options)
+    selected_agents = [agent_id for agent_id, label in AGENT_LABELS.items() if label in selected]
 
     # Show status during processing
     if processing and selected_agents:
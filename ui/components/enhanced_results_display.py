@@ -8,29 +8,44 @@ Enhanced results display component with intelligent synthesis across agents
 
 import streamlit as st
 import re
+from functools import lru_cache
 from typing import Dict, List, Any
 from collections import Counter
 
 
+_TAG_RE = re.compile(r'<[^>]+>')
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_ITALIC_RE = re.compile(r'\*([^*]+)\*')
+_HEADING_RE = re.compile(r'#{1,6}\s+')
+_CODE_RE = re.compile(r'`([^`]+)`')
+_CITATION_RE = re.compile(r'\[\d+\]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s.,!?;:()\-\']')
+
+
 def clean_text(text: str) -> str:
     """Remove all HTML/XML tags, special characters, and markdown formatting"""
     if not text or not isinstance(text, str):
         return ""
-    
+    return _clean_text_cached(text)
+
+
+# Findings and source titles are cleaned again on every Streamlit rerun
+@lru_cache(maxsize=4096)
+def _clean_text_cached(text: str) -> str:
     # Remove HTML/XML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _TAG_RE.sub('', text)
     # Remove markdown formatting
-    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
-    text = re.sub(r'\*([^*]+)\*', r'\1', text)
-    text = re.sub(r'#{1,6}\s+', '', text)
-    text = re.sub(r'`([^`]+)`', r'\1', text)
+    text = _BOLD_RE.sub(r'\1', text)
+    text = _ITALIC_RE.sub(r'\1', text)
+    text = _HEADING_RE.sub('', text)
+    text = _CODE_RE.sub(r'\1', text)
     # Remove citation markers
-    text = re.sub(r'\[\d+\]', '', text)
+    text = _CITATION_RE.sub('', text)
     # Clean whitespace
-    text = re.sub(r'\s+', ' ', text)
-    text = re.sub(r'[^\w\s.,!?;:()\-\']', '', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     
-    return text.strip()
+    return _SPECIAL_CHARS_RE.sub('', text).strip()
 
 
 def synthesize_summary(agent_results: List[Dict], query: str, domain: str) -> str:
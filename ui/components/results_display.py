@@ -7,9 +7,17 @@ Results display component with proper HTML/XML cleaning and hyperlinked sources
 
 import streamlit as st
 import re
+from functools import lru_cache
 from typing import Dict, List, Any
 
 
+_TAG_RE = re.compile(r'<[^>]+>')
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_ITALIC_RE = re.compile(r'\*([^*]+)\*')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s.,!?;:()\-\']')
+
+
 def clean_text(text: str) -> str:
     """
     Remove all HTML/XML tags, special characters, and markdown formatting
@@ -22,21 +30,24 @@ def clean_text(text: str) -> str:
     """
     if not text or not isinstance(text, str):
         return ""
-    
+    return _clean_text_cached(text)
+
+
+# The same titles and summaries are cleaned again on every Streamlit rerun
+@lru_cache(maxsize=4096)
+def _clean_text_cached(text: str) -> str:
     # Remove HTML/XML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _TAG_RE.sub('', text)
     
     # Remove markdown bold/italic
-    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
-    text = re.sub(r'\*([^*]+)\*', r'\1', text)
+    text = _BOLD_RE.sub(r'\1', text)
+    text = _ITALIC_RE.sub(r'\1', text)
     
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     
     # Remove special characters but keep basic punctuation
-    text = re.sub(r'[^\w\s.,!?;:()\-\']', '', text)
-    
-    return text.strip()
+    return _SPECIAL_CHARS_RE.sub('', text).strip()
 
 
 def render_results(results: Dict):
@@ -44,7 +44,7 @@ def render_sidebar():
     st.subheader("Statistics")
     
     total_queries = len(st.session_state.get('cost_history', []))
-    total_cost = sum([c.get('cost', 0) for c in st.session_state.get('cost_history', [])])
+    total_cost = sum(c.get('cost', 0) for c in st.session_state.get('cost_history', []))
     
     col1, col2 = st.columns(2)
     with col1:
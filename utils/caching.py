@@ -1,2 +1,79 @@
+"""
+Response caching helpers
+SQLite-backed cache for paid LLM/API responses so repeat queries are free
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+
+from utils.fast_json import dumps, loads
+
+
 def cache_result(key, value):
-    return value
\ No newline at end of file
+    return value
+
+
+def make_cache_key(model, messages, temperature=None, max_tokens=None):
+    """Build a stable key from the request fields that affect the response"""
+    normalized = [
+        {"role": m.get("role"), "content": " ".join(str(m.get("content", "")).lower().split())}
+        for m in messages
+    ]
+    payload = json.dumps(
+        [model, normalized, temperature, max_tokens],
+        sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Small key/value cache stored in SQLite with per-entry expiry.
+    A new connection is opened per operation so it is safe to share
+    between the concurrently running agents.
+    """
+
+    def __init__(self, db_path="data/cache/llm_cache.sqlite3"):
+        self.db_path = Path(db_path)
+        self._ready = False
+
+    def _connect(self):
+        if not self._ready:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        if not self._ready:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._ready = True
+        return conn
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing/expired"""
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None or row[1] < time.time():
+            return None
+        return loads(row[0])
+
+    def set(self, key, value, ttl=86400):
+        """Store a JSON-serializable value for ttl seconds"""
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, dumps(value), time.time() + ttl)
+                )
+        except sqlite3.Error:
+            pass
@@ -0,0 +1,30 @@
+"""
+Fast JSON helpers
+Drop-in loads/dumps backed by orjson when it is installed, stdlib json otherwise
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+if orjson is not None:
+    # Accepts str or bytes, so response bodies can be parsed without decoding first
+    loads = orjson.loads
+
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(value, indent=False):
+        """Serialize value to a UTF-8 JSON string, compact unless indent is set"""
+        option = _OPTIONS | orjson.OPT_INDENT_2 if indent else _OPTIONS
+        return orjson.dumps(value, option=option).decode("utf-8")
+else:  # pragma: no cover - stdlib fallback
+    loads = json.loads
+
+    def dumps(value, indent=False):
+        """Serialize value to a UTF-8 JSON string, compact unless indent is set"""
+        if indent:
+            return json.dumps(value, ensure_ascii=False, indent=2)
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
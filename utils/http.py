@@ -0,0 +1,43 @@
+"""
+Shared HTTP connection pools
+Agents reuse keep-alive connections instead of opening a session per request
+"""
+
+import asyncio
+import weakref
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - callers fall back to their sync clients
+    aiohttp = None
+
+# aiohttp sessions are bound to the event loop that created them, so one is kept per loop
+_ASYNC_SESSIONS = weakref.WeakKeyDictionary()
+
+
+def get_async_session():
+    """
+    Return the pooled aiohttp session for the running event loop, creating it lazily
+    Headers and timeouts are passed per request; whoever owns the loop (the code
+    calling asyncio.run) awaits close_async_session() before the loop ends
+    """
+    loop = asyncio.get_running_loop()
+    session = _ASYNC_SESSIONS.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=16,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            )
+        )
+        _ASYNC_SESSIONS[loop] = session
+    return session
+
+
+async def close_async_session():
+    """Close the pooled session of the running event loop, if one was opened"""
+    session = _ASYNC_SESSIONS.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
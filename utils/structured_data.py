@@ -1,7 +1,8 @@
 ﻿"""Utilities for building structured research records."""
 from __future__ import annotations
 
-from typing import Any, Iterable, List, Optional
+from itertools import starmap
+from typing import Any, Iterable, List, Optional, Sequence
 
 
 def _normalize_authors(authors: Any) -> List[str]:
@@ -40,6 +41,27 @@ def _format_date(value: Any) -> Optional[str]:
     return None
 
 
+def _record(
+    title: Optional[str],
+    summary: Optional[str],
+    content: Optional[str],
+    source: Optional[str],
+    published_date: Any,
+    authors: Any,
+    pdf_url: Optional[str],
+) -> dict:
+    """Shared field mapping behind the single and bulk builders."""
+    return {
+        "published_date": _format_date(published_date),
+        "title": title,
+        "authors": _normalize_authors(authors),
+        "summary": summary,
+        "content": content,
+        "source": source,
+        "pdf_url": pdf_url,
+    }
+
+
 def build_structured_record(
     *,
     title: Optional[str] = None,
@@ -51,12 +73,9 @@ def build_structured_record(
     pdf_url: Optional[str] = None,
 ) -> dict:
     """Return a dictionary with unified research fields."""
-    return {
-        "published_date": _format_date(published_date),
-        "title": title,
-        "authors": _normalize_authors(authors),
-        "summary": summary,
-        "content": content,
-        "source": source,
-        "pdf_url": pdf_url,
-    }
+    return _record(title, summary, content, source, published_date, authors, pdf_url)
+
+
+def build_structured_records_bulk(rows: Iterable[Sequence[Any]]) -> List[dict]:
+    """Return one record per ``(title, summary, content, source, published_date, authors, pdf_url)`` row."""
+    return list(starmap(_record, rows))
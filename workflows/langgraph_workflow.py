@@ -13,6 +13,8 @@ import re
 from typing import Dict, List, Any, Optional, Set
 from datetime import datetime
 
+from utils.http import close_async_session
+
 
 class ResearchWorkflow:
     """
@@ -127,7 +129,11 @@ class ResearchWorkflow:
         
         # Wait for all agents to complete
         print(f"\n   ⏳ Executing {len(tasks)} agents in parallel...")
-        agent_results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            agent_results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            # Agents share the loop's pooled aiohttp session; release it before the caller's loop ends
+            await close_async_session()
         
         # Process results
         processed_results = []